@@ -1,12 +1,36 @@
 import numpy as np
 import pandas as pd
-from matplotlib.gridspec import GridSpec
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
-import matplotlib.colors as mcolors
-import seaborn as sns
 
-from pyPMF import readers, plotter, get_sourcesCategories, add_season
+from pyPMF import readers, get_sourcesCategories, add_season
+
+# carbon mass fraction of the organic species, used to recompute OC
+_EQUIVC = pd.Series({
+    'Oxalate': 0.27,
+    'Arabitol': 0.40,
+    'Mannitol': 0.40,
+    'Sorbitol': 0.40,
+    'Polyols': 0.40,
+    'Levoglucosan': 0.44,
+    'Mannosan': 0.44,
+    'Galactosan': 0.44,
+    'MSA': 0.12,
+    'Glucose': 0.44,
+    'Cellulose': 0.44,
+    'Maleic': 0.41,
+    'Succinic': 0.41,
+    'Citraconic': 0.46,
+    'Glutaric': 0.45,
+    'Oxoheptanedioic': 0.48,
+    'MethylSuccinic': 0.53,
+    'Adipic': 0.49,
+    'Methylglutaric': 0.49,
+    '3-MBTCA': 0.47,
+    'Phtalic': 0.58,
+    'Pinic': 0.58,
+    'Suberic': 0.55,
+    'Azelaic': 0.57,
+    'Sebacic': 0.59,
+}, dtype=np.float64)
 
 class PMF(object):
 
@@ -50,11 +74,13 @@ class PMF(object):
                     SQL_program=SQL_program, SQL_connection=SQL_connection, SQL_table_names=SQL_table_names
                     )
 
-        self.plot = plotter.Plotter(pmf=self, savedir=savedir)
+        self._savedir = savedir
+        self._plot = None
 
         self.profiles = None
         self.nprofiles = None
         self.species = None
+        self._species_set = set()
         self.nspecies = None
         self.totalVar = None
         self.dfprofiles_b = None
@@ -70,6 +96,48 @@ class PMF(object):
         self.df_uncertainties_summary_b = None
         self.df_uncertainties_summary_c = None
 
+        self._specie_row_cache = {}
+
+    @property
+    def plot(self):
+        """The Plotter of this PMF, created (and matplotlib imported) on first
+        use."""
+        if self._plot is None:
+            from pyPMF import plotter
+            self._plot = plotter.Plotter(pmf=self, savedir=self._savedir)
+        return self._plot
+
+    def _get_specie_row(self, specie, constrained=True):
+        """Get the profiles row of the given specie, cached per run.
+
+        The cache is bound to the profiles DataFrame it was computed from, so
+        re-reading the profiles invalidates it. Methods modifying the profiles
+        in place clear it.
+
+        Parameters
+        ----------
+
+        specie : str
+        constrained : Boolean, default True
+
+        Return
+        ------
+
+        row : pd.Series, indexed by profile
+        """
+        if constrained:
+            dfprofiles = self.dfprofiles_c
+        else:
+            dfprofiles = self.dfprofiles_b
+
+        key = (constrained, specie)
+        cached = self._specie_row_cache.get(key)
+        if cached is None or cached[0] is not dfprofiles:
+            cached = (dfprofiles, dfprofiles.loc[specie].astype(float))
+            self._specie_row_cache[key] = cached
+
+        return cached[1]
+
     def to_cubic_meter(self, specie=None, constrained=True, profiles=None):
         """Convert the contribution in cubic meter for the given specie
 
@@ -94,15 +162,13 @@ class PMF(object):
 
         if constrained:
             df = self.dfcontrib_c
-            dfprofiles = self.dfprofiles_c
         else:
             df = self.dfcontrib_b
-            dfprofiles = self.dfprofiles_b
-
-        contrib = pd.DataFrame(index=df.index, columns=profiles)
 
-        for profile in profiles:
-            contrib[profile] = df[profile] * dfprofiles.loc[specie, profile]
+        # one float64 block, broadcast on the profiles axis
+        values = df[profiles].to_numpy(dtype=float) \
+                * self._get_specie_row(specie, constrained)[profiles].to_numpy()
+        contrib = pd.DataFrame(values, index=df.index, columns=list(profiles), copy=False)
 
         return contrib
 
@@ -134,7 +200,10 @@ class PMF(object):
         if species is None:
             species = self.species
 
-        d = df[profiles] / df.loc[self.totalVar, profiles]
+        sub = df.loc[:, profiles]
+        values = sub.to_numpy(dtype=float) \
+                / df.loc[self.totalVar, profiles].to_numpy(dtype=float)
+        d = pd.DataFrame(values, index=sub.index, columns=list(profiles), copy=False)
 
         return d
 
@@ -155,12 +224,14 @@ class PMF(object):
             The normalized species sum per profiles
         """
         if constrained:
-            df = self.dfprofiles_c.copy()
+            df = self.dfprofiles_c
         else:
-            df = self.dfprofiles_b.copy()
+            df = self.dfprofiles_b
 
-        # df = (self.dfprofiles_c.T / self.dfprofiles_c.sum(axis=1)).T * 100
-        df = (df.T / df.sum(axis=1)).T * 100
+        # single output buffer, normalized in place
+        values = df.to_numpy(dtype=float, copy=True)
+        values *= 100 / np.nansum(values, axis=1, keepdims=True)
+        df = pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
         return df
 
     def get_seasonal_contribution(self, specie=None, annual=True,
@@ -188,14 +259,12 @@ class PMF(object):
                 self.read.read_constrained_profiles()
             if self.dfcontrib_c is None:
                 self.read.read_constrained_contributions()
-            dfprofiles = self.dfprofiles_c
             dfcontrib = self.dfcontrib_c
         else:
             if self.dfprofiles_b is None:
                 self.read.read_base_profiles()
             if self.dfcontrib_b is None:
                 self.read.read_base_contributions()
-            dfprofiles = self.dfprofiles_b
             dfcontrib = self.dfcontrib_b
 
         if specie is None:
@@ -204,20 +273,24 @@ class PMF(object):
             specie = self.totalVar
 
 
-        dfcontribSeason = (dfprofiles.loc[specie] * dfcontrib).sort_index(axis=1)
+        # float block with already sorted columns: no sort nor dtype inference after
+        dfcontribSeason = self.to_cubic_meter(
+            specie=specie, constrained=constrained, profiles=sorted(dfcontrib.columns)
+        )
         ordered_season = ["Winter", "Spring", "Summer", "Fall"]
         if annual:
             ordered_season.append("Annual")
 
-        dfcontribSeason = add_season(dfcontribSeason, month=False)\
-                .infer_objects()
-        dfcontribSeason = dfcontribSeason.groupby("season")
+        # the season is categorical: grouped on its integer codes
+        dfcontribSeason = add_season(dfcontribSeason, month=False)
+        dfcontribSeason = dfcontribSeason.groupby("season", observed=True, sort=False)
 
         if normalize:
-            df = (dfcontribSeason.sum().T / dfcontribSeason.sum().sum(axis=1))
-            df = df.T
+            season_sum = dfcontribSeason.sum()
+            df = season_sum.div(season_sum.sum(axis=1), axis=0)
         else:
             df = dfcontribSeason.mean()
+        df.index = df.index.astype(object)
 
         if annual:
             df.loc["Annual", :] = df.mean()
@@ -234,21 +307,26 @@ class PMF(object):
 
         newTotalVar : str
         """
-        DF = [
+        DF = tuple(df for df in (
             self.dfprofiles_b,
             self.dfprofiles_c,
             self.dfBS_profile_b,
             self.dfBS_profile_c,
             self.df_uncertainties_summary_b,
             self.df_uncertainties_summary_c,
-        ]
+        ) if df is not None)
         for df in DF:
-            if df is None:
-                continue
             df.rename({self.totalVar: newTotalVar}, inplace=True, axis=0)
 
-        self.species = [newTotalVar if x == self.totalVar else x for x in self.species]
+        # totalVar is unique in species: update it in place
+        try:
+            self.species[self.species.index(self.totalVar)] = newTotalVar
+            self._species_set.discard(self.totalVar)
+            self._species_set.add(newTotalVar)
+        except ValueError:
+            pass
         self.totalVar = newTotalVar
+        self._specie_row_cache.clear()
 
     def rename_factors(self, mapper):
         """Rename factors names in all dataframe
@@ -259,7 +337,7 @@ class PMF(object):
         mapper : dict
             Key of the dictionnary are the old name, and value the desired name
         """
-        DF = [
+        DF = tuple(df for df in (
             self.dfprofiles_b,
             self.dfprofiles_c,
             self.dfcontrib_b,
@@ -268,24 +346,33 @@ class PMF(object):
             self.dfBS_profile_c,
             self.df_uncertainties_summary_b,
             self.df_uncertainties_summary_c,
-        ]
+        ) if df is not None)
         for df in DF:
-            if df is None:
-                continue
+            # rename both axes in one call, only where labels are names
+            axes = {}
             if df.index.dtype == 'O':
-                df.rename(mapper, inplace=True, axis="index")
+                axes["index"] = mapper
             if df.columns.dtype == 'O':
-                df.rename(mapper, inplace=True, axis="columns")
+                axes["columns"] = mapper
+            if axes:
+                df.rename(inplace=True, **axes)
 
         self.profiles = [mapper.get(p, p) for p in self.profiles]
+        self._specie_row_cache.clear()
 
     def rename_factors_to_factors_category(self):
         """Rename the factor profile name to match the category
 
         See pyPMF.utils.get_sourcesCategories
         """
-        possible_sources = {p: get_sourcesCategories([p])[0] for p in self.profiles}
-        self.rename_factors(possible_sources)
+        # only keep the factors that actually change name
+        possible_sources = {
+            p: category
+            for p, category in zip(self.profiles, get_sourcesCategories(self.profiles))
+            if p != category
+        }
+        if possible_sources:
+            self.rename_factors(possible_sources)
 
     def recompute_new_species(self, specie):
         """Recompute a specie given the other species. For instance, recompute OC
@@ -304,45 +391,20 @@ class PMF(object):
         if specie not in knownSpecies:
             return
 
-        equivC = {
-            'Oxalate': 0.27,
-            'Arabitol': 0.40,
-            'Mannitol': 0.40,
-            'Sorbitol': 0.40,
-            'Polyols': 0.40,
-            'Levoglucosan': 0.44,
-            'Mannosan': 0.44,
-            'Galactosan': 0.44,
-            'MSA': 0.12,
-            'Glucose': 0.44,
-            'Cellulose': 0.44,
-            'Maleic': 0.41,
-            'Succinic': 0.41,
-            'Citraconic': 0.46,
-            'Glutaric': 0.45,
-            'Oxoheptanedioic': 0.48,
-            'MethylSuccinic': 0.53,
-            'Adipic': 0.49,
-            'Methylglutaric': 0.49,
-            '3-MBTCA': 0.47,
-            'Phtalic': 0.58,
-            'Pinic': 0.58,
-            'Suberic': 0.55,
-            'Azelaic': 0.57,
-            'Sebacic': 0.59,
-        }
-
         if specie == "OC":
-            if specie not in self.species:
+            if specie not in self._species_set:
                 self.species.append(specie)
-            OCb = self.dfprofiles_b.loc["OC*"].copy()
-            OCc = self.dfprofiles_c.loc["OC*"].copy()
-            for sp in equivC.keys():
-                if sp in self.species:
-                    OCb += (self.dfprofiles_b.loc[sp] * equivC[sp]).infer_objects()
-                    OCc += (self.dfprofiles_c.loc[sp] * equivC[sp]).infer_objects()
-            self.dfprofiles_b.loc[specie] = OCb.infer_objects()
-            self.dfprofiles_c.loc[specie] = OCc.infer_objects()
+                self._species_set.add(specie)
+            present = [sp for sp in _EQUIVC.index if sp in self._species_set]
+            weights = _EQUIVC.loc[present].to_numpy()
+            # work on float arrays: no dtype inference needed afterward
+            OCb = self.dfprofiles_b.loc["OC*"].to_numpy(dtype=float) \
+                    + weights.dot(self.dfprofiles_b.loc[present].to_numpy(dtype=float))
+            OCc = self.dfprofiles_c.loc["OC*"].to_numpy(dtype=float) \
+                    + weights.dot(self.dfprofiles_c.loc[present].to_numpy(dtype=float))
+            self.dfprofiles_b.loc[specie] = OCb
+            self.dfprofiles_c.loc[specie] = OCc
+            self._specie_row_cache.clear()
 
     def print_uncertainties_summary(self, constrained=True, profiles=None,
             species=None):
@@ -385,4 +447,4 @@ class PMF(object):
                 self.read.read_metadata()
             species = self.species
 
-        return df.T.loc[:, (profiles, species)]
+        return df.loc[(profiles, species), :].T
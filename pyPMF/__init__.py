@@ -1,4 +1,11 @@
 from pyPMF.utils import get_sourcesCategories, add_season
 import pyPMF.readers as readers
-import pyPMF.plotter as plotter
 from pyPMF.PMF import PMF
+
+
+def __getattr__(name):
+    # matplotlib/seaborn are only imported when plotting (see PMF.plot)
+    if name == "plotter":
+        import importlib
+        return importlib.import_module("pyPMF.plotter")
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,39 +1,52 @@
+import itertools
+import os
 import warnings
 import numpy as np
 import pandas as pd
+import matplotlib
+# non-interactive backend for batch saving, see docs/usage.rst
+if os.environ.get("PYPMF_HEADLESS"):
+    matplotlib.use("Agg", force=True)
 from matplotlib.gridspec import GridSpec
+from matplotlib.collections import PolyCollection
+from matplotlib.backends.backend_pdf import PdfPages
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-import matplotlib.colors as mcolors
+import matplotlib.dates as mdates
 import seaborn as sns
 
 from .utils import get_sourceColor, add_season
 
+# source name -> hexadecimal color
+_SOURCE_COLORS = get_sourceColor()
+
+# resolution of the rasterized artists (markers, boxes) in the vector figures
+_RASTER_DPI = 300
+_VECTOR_FORMATS = ("pdf", "svg", "eps", "ps")
+
+_SPECIES_MAP = {
+    "Cl-": "Cl$^-$",
+    "Na+": "Na$^+$",
+    "K+": "K$^+$",
+    "NO3-": "NO$_3^-$",
+    "NH4+": "NH$_4^+$",
+    "SO42-": "SO$_4^{2-}$",
+    "Mg2+": "Mg$^{2+}$",
+    "Ca2+": "Ca$^{2+}$",
+    "nss-SO42-": "nss-SO$_4^{2-}$",
+    "OP_DTT_m3": "OP$^{DTT}_v$",
+    "OP_AA_m3": "OP$^{AA}_v$",
+    "OP_DTT_µg": "OP$^{DTT}_m$",
+    "OP_AA_µg": "OP$^{AA}_m$",
+    "PM_µg/m3": "PM mass",
+}
+
 def _pretty_specie(text):
-    map_species = {
-        "Cl-": "Cl$^-$",
-        "Na+": "Na$^+$",
-        "K+": "K$^+$",
-        "NO3-": "NO$_3^-$",
-        "NH4+": "NH$_4^+$",
-        "SO42-": "SO$_4^{2-}$",
-        "Mg2+": "Mg$^{2+}$",
-        "Ca2+": "Ca$^{2+}$",
-        "nss-SO42-": "nss-SO$_4^{2-}$",
-        "OP_DTT_m3": "OP$^{DTT}_v$",
-        "OP_AA_m3": "OP$^{AA}_v$",
-        "OP_DTT_µg": "OP$^{DTT}_m$",
-        "OP_AA_µg": "OP$^{AA}_m$",
-        "PM_µg/m3": "PM mass",
-    }
-    if text in map_species.keys():
-        return map_species[text]
-    else:
-        return text
+    return _SPECIES_MAP.get(text, text)
 
 def pretty_specie(text):
     if isinstance(text, list):
-        mapped = [_pretty_specie(x) for x in text]
+        mapped = [_SPECIES_MAP.get(x, x) for x in text]
     elif isinstance(text, str):
         mapped = _pretty_specie(text)
     else:
@@ -42,6 +55,46 @@ def pretty_specie(text):
         )
     return mapped
 
+def _stackedbar_geometry(t_i8, values):
+    """Compute the widths and bottoms of a time series stacked bar plot.
+
+    Parameters
+    ----------
+
+    t_i8 : np.ndarray of int64
+        Dates of the samples, in nanoseconds.
+    values : np.ndarray of float, shape (n_dates, n_profiles)
+        Height of each bar.
+
+    Returns
+    -------
+
+    widths : np.ndarray of float
+        1.5 when no overlapping, 1 otherwise (less than 2 days with the
+        previous or next sample).
+    bottoms : np.ndarray of float, shape (n_dates, n_profiles+1)
+        The bottom of the i-th bar is the cumulative sum of the i-1 previous
+        ones.
+    """
+    two_days = np.int64(2 * 86400 * 10**9)
+    diffs = np.diff(t_i8)
+    sentinel = [two_days]
+    deltar = np.concatenate([sentinel, diffs])
+    deltal = np.concatenate([diffs, sentinel])
+    widths = np.where((deltal < two_days) | (deltar < two_days), 1., 1.5)
+
+    bottoms = np.zeros((values.shape[0], values.shape[1]+1))
+    np.nancumsum(values, axis=1, out=bottoms[:, 1:])
+    return widths, bottoms
+
+# PMF output needed by a plot: (attribute prefix, reader name template)
+_LOADERS = {
+    "profiles": ("dfprofiles", "read_{}_profiles"),
+    "contrib": ("dfcontrib", "read_{}_contributions"),
+    "BS": ("dfBS_profile", "read_{}_bootstrap"),
+    "DISP": ("df_uncertainties_summary", "read_{}_uncertainties_summary"),
+}
+
 class Plotter():
     """
     Lot's of plot in this class for a PMF object!
@@ -50,7 +103,7 @@ class Plotter():
         self.pmf = pmf
         self.savedir = savedir
 
-    def _save_plot(self, formats=["png"], name="plot", DIR=""):
+    def _save_plot(self, formats=["png"], name="plot", DIR="", dpi=None):
         """Save plot in a given format.
         
         Parameters
@@ -59,14 +112,82 @@ class Plotter():
         formats : list of str, format of the figure (see plt.savefig)
         name : string, default "plot". File name.
         DIR : string, default "". Directory for saving.
+        dpi : float, default None (matplotlib default). Resolution of the
+            rasterized artists in the vector formats (pdf, svg, eps, ps). The
+            raster formats keep the matplotlib default.
         """
         for fmt in formats:
             plt.savefig("{DIR}{name}.{fmt}".format(DIR=DIR,
-                                                   name=name.replace("/", "-"), fmt=fmt))
+                                                   name=name.replace("/", "-"), fmt=fmt),
+                        dpi=dpi if fmt in _VECTOR_FORMATS else None)
+
+    def _ensure_loaded(self, constrained=True, need=()):
+        """Read the PMF outputs needed by a plot, if not already read.
+
+        Parameters
+        ----------
+
+        constrained : Boolean, default True
+            Either to read the constrained run or the base one
+        need : iterable of str
+            Outputs to read, among "profiles", "contrib", "BS", "DISP" and
+            "meta" (profiles, species and total variable names).
+        """
+        pmf = self.pmf
+        run = "constrained" if constrained else "base"
+        suffix = "_c" if constrained else "_b"
+
+        for item in need:
+            if item == "meta":
+                if pmf.profiles is None or pmf.species is None or pmf.totalVar is None:
+                    pmf.read.read_metadata()
+                continue
+            attr, reader = _LOADERS[item]
+            if getattr(pmf, attr+suffix) is None:
+                getattr(pmf.read, reader.format(run))()
+
+    @staticmethod
+    def _scatter_ref(ax, dref, species, **kwargs):
+        """Draw the reference run as red dots over the categorical species axis.
+
+        Parameters
+        ----------
+
+        ax : matplotlib.axes.Axes
+        dref : pd.Series
+            Value of the reference run, indexed by species.
+        species : list of str
+            Species to plot, in the order of the x-axis.
+        """
+        # same marker as sns.stripplot: size=5 (area 25), no edge
+        kwargs.setdefault("s", 25)
+        kwargs.setdefault("linewidth", 0)
+        positions = np.arange(len(species))
+        ax.scatter(positions, dref.reindex(species).to_numpy(dtype=float),
+                   color="red", marker="o", zorder=3, **kwargs)
+        ax.set_xticks(positions)
+        ax.set_xticklabels(species)
+        ax.set_xlim(-0.5, len(species) - 0.5)
+
+    @staticmethod
+    def _rasterize_data(ax):
+        """Rasterize the data artists (markers, boxes, bars) of the axe, while
+        keeping axis, ticks and labels as vector.
+
+        Parameters
+        ----------
+
+        ax : matplotlib.axes.Axes
+        """
+        for artist in ax.collections + ax.patches + ax.lines:
+            artist.set_rasterized(True)
 
     def _plot_per_microgramm(self, df=None, constrained=True, profile=None, species=None,
                              new_figure=False, **kwargs):
         """Internal method
+
+        df is expected to have its zeros already masked as NaN (see
+        plot_per_microgramm), so that they do not show up on the log scale.
         """
         pmf = self.pmf
 
@@ -82,20 +203,20 @@ class Plotter():
             dfprofiles = pmf.dfprofiles_b
 
         if df is not None:
-            d = df.xs(profile, level="Profile") \
-                    / (df.xs(profile, level="Profile").loc[pmf.totalVar])
+            d = df.xs(profile, level="Profile")
+            d = d.div(d.loc[pmf.totalVar], axis=1)
             d = d.reindex(species).unstack().reset_index()
         else:
             d = None
 
         dref = dfprofiles[profile] / dfprofiles.loc[pmf.totalVar, profile]
-        dref = dref.reset_index()
+        dref = dref.mask(dref == 0)
 
         if df is not None:
-            sns.boxplot(data=d.replace({0: np.nan}), x="Specie", y=0,
+            sns.boxplot(data=d, x="Specie", y=0,
                         color="grey", ax=ax)
-        sns.stripplot(data=dref.replace({0: np.nan}), x="Specie", y=profile,
-                      ax=ax, jitter=False, color="red")
+        self._scatter_ref(ax, dref, species)
+        self._rasterize_data(ax)
         ax.set_yscale('log')
         ax.set_xticklabels(
             pretty_specie([t.get_text() for t in ax.get_xticklabels()]),
@@ -113,9 +234,30 @@ class Plotter():
         labels = ["Ref. run", "BS"]
         ax.legend(handles=handles, labels=labels, loc="upper left", bbox_to_anchor=(1., 1.), frameon=False)
 
+    @staticmethod
+    def _get_species_sum(df, species):
+        """Sum over the profiles of the mean of each specie, in a single pass.
+
+        Parameters
+        ----------
+
+        df : DataFrame with multiindex [species, profile] and an arbitrary
+           number of column.
+        species : list of str
+
+        Returns
+        -------
+
+        sumsp : DataFrame with species as columns and a single 'sum' row
+        """
+        sumsp = df.mean(axis=1).groupby(level="Specie").sum().reindex(species)
+        sumsp = sumsp.to_frame().T
+        sumsp.index = ['sum']
+        return sumsp
+
     def _plot_totalspeciesum(self, df=None, constrained=True, profile=None,
-                             species=None, sumsp=None, new_figure=False,
-                             **kwargs):
+                             species=None, sumsp=None, profile_sum=None,
+                             new_figure=False, **kwargs):
         """TODO: Docstring for _plot_totalspeciesum.
 
         Parameters
@@ -126,6 +268,8 @@ class Plotter():
         profile : TODO
         species : TODO
         sumsp : dataframe with the sum of each species
+        profile_sum : pd.Series, sum of each specie over the profiles of the
+            reference run. Computed if not given.
         new_figure : TODO
 
         """
@@ -143,23 +287,23 @@ class Plotter():
             dfprofiles = pmf.dfprofiles_b
 
         if sumsp is None and df is not None:
-            sumsp = pd.DataFrame(columns=species, index=['sum'])
-            for sp in species:
-                sumsp[sp] = df.loc[(sp, slice(None)), :].mean(axis=1).sum()
+            sumsp = self._get_species_sum(df, species)
 
         if df is not None:
             d = df.xs(profile, level="Profile").divide(sumsp.iloc[0], axis=0) * 100
             d.index.names = ["Specie"]
             d = d.reindex(species).unstack().reset_index()
 
-        dref = dfprofiles[profile].divide(dfprofiles.sum(axis=1)) * 100
-        dref = dref.reset_index()
+        if profile_sum is None:
+            profile_sum = dfprofiles.sum(axis=1)
+
+        dref = dfprofiles[profile].divide(profile_sum) * 100
 
         if df is not None:
             sns.barplot(data=d, x="Specie", y=0, color="grey", ci="sd", ax=ax, label="BS (sd)")
 
-        sns.stripplot(data=dref, x="Specie", y=0, color="red", jitter=False,
-                      ax=ax, label="Ref. run")
+        self._scatter_ref(ax, dref, species, label="Ref. run")
+        self._rasterize_data(ax)
         ax.set_xticklabels(
             pretty_specie([t.get_text() for t in ax.get_xticklabels()]),
             rotation=90
@@ -213,12 +357,13 @@ class Plotter():
         )
         with sns.axes_style("ticks"):
             if BS:
+                # (n_time, n_boot) outer product of contribution and BS profiles
+                contrib = dfcontrib[profile].to_numpy(dtype=float)
+                scales = dfBS.xs(profile, level="Profile").loc[specie].to_numpy(dtype=float)
                 d = pd.DataFrame(
-                    columns=dfBS.columns,
+                    contrib[:, None] * scales[None, :],
                     index=dfcontrib.index
                 )
-                for BS in dfBS.columns:
-                    d[BS] = dfcontrib[profile] * dfBS.xs(profile, level="Profile").loc[specie][BS]
                 mstd = d.std(axis=1)
                 ma = d.mean(axis=1)
                 plt.fill_between(
@@ -227,14 +372,11 @@ class Plotter():
                 )
                 # d.mean(axis=1).plot(marker="*")
             if DISP:
-                d = pd.DataFrame(
-                    columns=dfDISP.columns,
-                    index=dfcontrib.index
-                )
-                for DISP in ["DISP Min", "DISP Max"]:
-                    d[DISP] = dfcontrib[profile] * dfDISP.xs(profile, level="Profile").loc[specie][DISP]
+                disp = dfDISP.loc[(profile, specie), ["DISP Min", "DISP Max"]]
+                contrib = dfcontrib[profile].to_numpy(dtype=float)
                 plt.fill_between(
-                    d.index, d["DISP Min"], d["DISP Max"],
+                    dfcontrib.index,
+                    contrib * disp["DISP Min"], contrib * disp["DISP Max"],
                     label="DISP (min-max)", **fill_kwarg
                 )
             plt.plot(
@@ -247,7 +389,8 @@ class Plotter():
             ax.legend(loc="upper left", bbox_to_anchor=(1., 1.), frameon=False)
 
     def _plot_profile(self, constrained=True, dfcontrib=None, dfBS=None, dfDISP=None, profile=None,
-                      specie=None, BS=False, DISP=False, BSDISP=False):
+                      specie=None, BS=False, DISP=False, BSDISP=False, fig=None,
+                      dfBS_nz=None):
         """TODO: Docstring for _plot_profile.
 
         constrained : Boolean, either to use the constrained run or the base one
@@ -257,20 +400,35 @@ class Plotter():
         BS : TODO
         DISP : TODO
         BSDISP : TODO
+        fig : matplotlib.figure.Figure, optional
+            Figure to reuse (it is cleared first). Default to a new figure.
+        dfBS_nz : pd.DataFrame, optional
+            dfBS with its zeros masked as NaN. Computed from dfBS if not given.
 
+        Returns
+        -------
+
+        fig : matplotlib.figure.Figure
         """
         pmf = self.pmf
 
         gs_profile = GridSpec(nrows=2, ncols=1, top=0.95, bottom=0.41, hspace=0.15)
         gs_contrib = GridSpec(nrows=3, ncols=1)
 
-        fig = plt.figure(figsize=(12, 12))
+        if fig is None:
+            fig = plt.figure(figsize=(12, 12))
+        else:
+            fig.clear()
+            plt.figure(fig.number)
         ax1 = fig.add_subplot(gs_profile[0])
         ax2 = fig.add_subplot(gs_profile[1], sharex=ax1)
         ax3 = fig.add_subplot(gs_contrib[2])
 
+        if dfBS_nz is None and dfBS is not None:
+            dfBS_nz = dfBS.where(dfBS != 0)
+
         self._plot_per_microgramm(
-            df=dfBS, constrained=constrained, profile=profile, species=pmf.species,
+            df=dfBS_nz, constrained=constrained, profile=profile, species=pmf.species,
             new_figure=False, ax=ax1
         )
 
@@ -307,41 +465,73 @@ class Plotter():
             wspace=0.015
         )
 
-    def _plot_ts_stackedbarplot(self, df, ax):
-        idx = df.index
-        c = get_sourceColor()
+        return fig
 
+    @staticmethod
+    def _plot_ts_stackedbarplot(df, ax):
         # Date index
         x = df.index
 
-        # Width
-        # Set it to 1.5 when no overlapping, 1 otherwise.
-        width = np.ones(len(x))*1.5
-        deltal = x[1:]-x[:-1]
-        deltal = deltal.append(pd.TimedeltaIndex([10,], 'D'))
-        deltar = pd.TimedeltaIndex([3], 'D')
-        deltar = deltar.append(x[1:]-x[:-1])
-        width[deltal < np.timedelta64(2, 'D')] = 1
-        width[deltar < np.timedelta64(2, 'D')] = 1
-
-        # Stacked bar plot
-        count = 0
-        default_colors = iter(mcolors.TABLEAU_COLORS.values())
+        values = df.to_numpy(dtype=float)
+        width, bottoms = _stackedbar_geometry(
+            np.asarray(x, dtype="datetime64[ns]").view("i8"), values
+        )
+        # one PolyCollection of rectangles per profile, instead of one
+        # Rectangle artist per sample and profile
+        xnum = mdates.date2num(x)
+        left = xnum - width / 2
+        right = xnum + width / 2
+        heights = np.nan_to_num(values)
+        # same fallback as the axes color cycle, which never runs out
+        default_colors = itertools.cycle(
+            plt.rcParams["axes.prop_cycle"].by_key()["color"]
+        )
         for i in range(df.shape[1]):
-            bottom=df.iloc[:,0:count].sum(axis=1)
-            count += 1
-            try:
-                color = c[df.columns[i]]
-            except:
+            color = _SOURCE_COLORS.get(df.columns[i])
+            if color is None:
                 color = next(default_colors)
-            ax.bar(x, df[df.columns[i]],
-                   bottom=bottom,
-                   label=df.columns[i],
-                   width=width,
-                   color=color)
+            low = bottoms[:, i]
+            high = low + heights[:, i]
+            verts = np.stack([
+                np.column_stack([left, low]),
+                np.column_stack([left, high]),
+                np.column_stack([right, high]),
+                np.column_stack([right, low]),
+            ], axis=1)
+            ax.add_collection(
+                PolyCollection(verts, facecolors=color, linewidths=0,
+                               label=df.columns[i])
+            )
 
+        ax.xaxis_date()
+        ax.autoscale_view()
         ax.set_ylim(bottom=0)
 
+    @staticmethod
+    def _plot_stacked_bar(df, ax, colors, width=0.5):
+        """Stacked bar plot of the columns of df, one bar per row, as
+        df.plot(kind="bar", stacked=True) but with the bottoms computed once
+        in NumPy.
+
+        Parameters
+        ----------
+
+        df : pd.DataFrame
+        ax : matplotlib.axes.Axes
+        colors : list of str, one color per column
+        width : float, default 0.5
+        """
+        values = np.nan_to_num(df.to_numpy(dtype=float))
+        x = np.arange(values.shape[0])
+        bottoms = np.zeros(values.shape[0])
+        for j, column in enumerate(df.columns):
+            ax.bar(x, values[:, j], width, bottom=bottoms, color=colors[j],
+                   label=column)
+            bottoms += values[:, j]
+        ax.set_xticks(x)
+        ax.set_xticklabels(df.index, rotation=90)
+        ax.set_xlim(-0.5, len(x) - 0.5)
+
     def _get_polluted_days_mean(self, specie=None, constrained=True, threshold=None):
         """Get the mean contribution of the sources for the given specie for polluted and
         non-polluted days define by the threshold
@@ -365,25 +555,19 @@ class Plotter():
 
 
         df = self.pmf.to_cubic_meter(specie=specie, constrained=constrained)
-        df["polluted"] = df.sum(axis=1) > threshold
-        n_polluted = df["polluted"].sum()
-        n_not_polluted = df["polluted"].count() - n_polluted
-
-        df["polluted"].replace(
-                {
-                    True: "> {} µg/m³\n(n={})".format(threshold, n_polluted),
-                    False: "≤ {} µg/m³\n(n={})".format(threshold, n_not_polluted)
-                },
-                inplace=True
+        mask = (df.sum(axis=1) > threshold).to_numpy()
+        n_polluted = mask.sum()
+        n_not_polluted = mask.size - n_polluted
+
+        df["polluted"] = np.where(
+            mask,
+            "> {} µg/m³\n(n={})".format(threshold, n_polluted),
+            "≤ {} µg/m³\n(n={})".format(threshold, n_not_polluted)
         )
 
-        df = df.melt(id_vars=["polluted"], var_name=["Profile"], value_name=specie)\
-            .groupby(["polluted", "Profile"])\
-            .mean()\
-            .reset_index()\
-            .pivot(index=["polluted"], columns=["Profile"])
-
-        df.columns = df.columns.get_level_values("Profile")
+        profile_cols = [c for c in df.columns if c != "polluted"]
+        df = df.groupby("polluted")[profile_cols].mean()
+        df.columns.name = "Profile"
 
         return df
 
@@ -399,38 +583,29 @@ class Plotter():
         constrained : Boolean, either to use the constrained run or the base run
         profiles : list of str, profile to plot (one figure per profile)
         species : list of str, specie to plot (x-axis)
-        plot_save : boolean, default False. Save the graph in savedir.
+        plot_save : boolean, default False. Save the graph in savedir
+            and close it.
         savedir : string, directory to save the plot.
         """
         pmf = self.pmf
 
-        if df is None:
-            if constrained:
-                if pmf.dfBS_profile_c is None:
-                    pmf.read.read_constrained_bootstrap()
-                df = pmf.dfBS_profile_c
-                if pmf.dfprofiles_c is None:
-                    pmf.read.read_constrained_profiles()
-            else:
-                if pmf.dfBS_profile_b is None:
-                    pmf.read.read_base_bootstrap()
-                df = pmf.dfBS_profile_b
-                if pmf.dfprofiles_b is None:
-                    pmf.read.read_base_profiles()
-        elif not(isinstance(df, pd.DataFrame)):
+        if df is not None and not(isinstance(df, pd.DataFrame)):
             raise TypeError("df should be a pandas DataFrame.")
-        
+
+        self._ensure_loaded(
+            constrained=constrained,
+            need=("profiles", "meta") if df is not None else ("BS", "profiles", "meta")
+        )
+
+        if df is None:
+            df = pmf.dfBS_profile_c if constrained else pmf.dfBS_profile_b
 
         if profiles is None:
-            if pmf.profiles is None:
-                pmf.read.read_metadata()
             profiles = pmf.profiles
         elif not(isinstance(profiles, list)):
             raise TypeError("profiles should be a list.")
 
         if species is None:
-            if pmf.species is None:
-                pmf.read.read_metadata()
             species = pmf.species
         elif not(isinstance(species, list)):
             raise TypeError("species should be a list.")
@@ -438,12 +613,15 @@ class Plotter():
         if savedir is None:
             savedir = self.savedir
 
+        # mask the zeros once for all the profiles
+        df_nz = df.where(df != 0)
         for p in profiles:
-            self._plot_per_microgramm(df=df, constrained=constrained, profile=p, species=species,
+            self._plot_per_microgramm(df=df_nz, constrained=constrained, profile=p, species=species,
                                       new_figure=True)
             plt.subplots_adjust(left=0.1, right=0.9, bottom=0.3, top=0.9)
             if plot_save:
-                self._save_plot(DIR=savedir, name=p+"_profile_perµg")
+                self._save_plot(DIR=savedir, name=p+"_profile_perµg", dpi=_RASTER_DPI)
+                plt.close(plt.gcf())
 
     def plot_totalspeciesum(self, df=None, profiles=None, species=None, constrained=True,
                             plot_save=False, savedir=None, **kwargs):
@@ -456,33 +634,24 @@ class Plotter():
            number of column.  Default to dfBS_profile_c.
         profiles : list, profile to plot (one figure per profile)
         species : list, specie to plot (x-axis)
-        plot_save : boolean, default False. Save the graph in savedir.
+        plot_save : boolean, default False. Save the graph in savedir
+            and close it.
         savedir : string, directory to save the plot.
         """
         pmf = self.pmf
 
+        self._ensure_loaded(
+            constrained=constrained,
+            need=("profiles", "meta") if df is not None else ("BS", "profiles", "meta")
+        )
+
         if df is None:
-            if constrained:
-                if pmf.dfBS_profile_c is None:
-                    pmf.read.read_constrained_bootstrap()
-                df = pmf.dfBS_profile_c
-                if pmf.dfprofiles_c is None:
-                    pmf.read.read_constrained_profiles()
-            else:
-                if pmf.dfBS_profile_b is None:
-                    pmf.read.read_base_bootstrap()
-                df = pmf.dfBS_profile_b
-                if pmf.dfprofiles_b is None:
-                    pmf.read.read_base_profiles()
+            df = pmf.dfBS_profile_c if constrained else pmf.dfBS_profile_b
 
         if profiles is None:
-            if pmf.profiles is None:
-                pmf.read.read_metadata()
             profiles = pmf.profiles
 
         if species is None:
-            if pmf.species is None:
-                pmf.read.read_metadata()
             species = pmf.species
 
         if savedir is None:
@@ -490,16 +659,19 @@ class Plotter():
 
         new_figure = kwargs.pop("new_figure", True)
 
-        sumsp = pd.DataFrame(columns=species, index=['sum'])
-        for sp in species:
-            sumsp[sp] = df.loc[(sp, slice(None)),:].mean(axis=1).sum()
+        sumsp = self._get_species_sum(df, species)
+        dfprofiles = pmf.dfprofiles_c if constrained else pmf.dfprofiles_b
+        profile_sum = dfprofiles.sum(axis=1)
         for p in profiles:
-            self._plot_totalspeciesum(df=df, profile=p, species=species,
-                                      sumsp=sumsp, new_figure=new_figure,
-                                      **kwargs)
+            self._plot_totalspeciesum(df=df, constrained=constrained, profile=p,
+                                      species=species, sumsp=sumsp,
+                                      profile_sum=profile_sum,
+                                      new_figure=new_figure, **kwargs)
             plt.subplots_adjust(left=0.1, right=0.9, bottom=0.3, top=0.9)
             if plot_save:
-                self._save_plot(DIR=savedir, name=p+"_profile")
+                self._save_plot(DIR=savedir, name=p+"_profile", dpi=_RASTER_DPI)
+                if new_figure:
+                    plt.close(plt.gcf())
 
     def plot_contrib(self, dfBS=None, dfDISP=None, dfcontrib=None, profiles=None,
                      specie=None, constrained=True, plot_save=False, savedir=None,
@@ -519,53 +691,36 @@ class Plotter():
         specie : string, default totalVar.
             specie to plot (y-axis)
         plot_save : boolean, default False
-            Save the graph in savedir.
+            Save the graph in savedir and close it.
         savedir : string
             directory to save the plot
         """
         pmf = self.pmf
 
+        need = ["profiles", "meta"]
         if (dfBS is None) and (BS):
-            if constrained:
-                if pmf.dfBS_profile_c is None:
-                    pmf.read.read_constrained_bootstrap()
-                dfBS = pmf.dfBS_profile_c
-            else:
-                if pmf.dfBS_profile_b is None:
-                    pmf.read.read_base_bootstrap()
-                dfBS = pmf.dfBS_profile_b
+            need.append("BS")
+        if (dfDISP is None) and (DISP):
+            need.append("DISP")
+        if dfcontrib is None:
+            need.append("contrib")
+        self._ensure_loaded(constrained=constrained, need=need)
+
+        if (dfBS is None) and (BS):
+            dfBS = pmf.dfBS_profile_c if constrained else pmf.dfBS_profile_b
 
         if (dfDISP is None) and (DISP):
-            if constrained:
-                if pmf.df_uncertainties_summary_c is None:
-                    pmf.read.read_constrained_uncertainties_summary()
-                dfDISP = pmf.df_uncertainties_summary_c[["DISP Min", "DISP Max"]]
-            else:
-                if pmf.df_uncertainties_summary_b is None:
-                    pmf.read.read_base_uncertainties_summary()
-                dfDISP = pmf.df_uncertainties_summary_b[["DISP Min", "DISP Max"]]
+            dfDISP = pmf.df_uncertainties_summary_c if constrained \
+                    else pmf.df_uncertainties_summary_b
+            dfDISP = dfDISP[["DISP Min", "DISP Max"]]
 
         if dfcontrib is None:
-            if constrained:
-                if pmf.dfcontrib_c is None:
-                    pmf.read.read_constrained_contributions()
-                dfcontrib = pmf.dfcontrib_c
-            else:
-                if pmf.dfcontrib_b is None:
-                    pmf.read.read_base_contributions()
-                dfcontrib = pmf.dfcontrib_b
+            dfcontrib = pmf.dfcontrib_c if constrained else pmf.dfcontrib_b
 
         if profiles is None:
-            if pmf.profiles is None:
-                pmf.read.read_metadata()
             profiles = pmf.profiles
 
-        # if pmf.dfprofiles_c is None:
-        #     pmf.read.read_constrained_profiles()
-
         if specie is None:
-            if pmf.totalVar is None:
-                pmf.read.read_metadata()
             specie = pmf.totalVar
         elif not isinstance(specie, str):
             raise ValueError(
@@ -584,10 +739,12 @@ class Plotter():
             plt.subplots_adjust(left=0.1, right=0.85, bottom=0.1, top=0.9)
             if plot_save:
                 self._save_plot(DIR=savedir, name=p+"_contribution")
+                if new_figure:
+                    plt.close(plt.gcf())
 
     def plot_all_profiles(self, constrained=True, profiles=None, specie=None,
                           BS=True, DISP=True, BSDISP=False, plot_save=False,
-                          savedir=None):
+                          savedir=None, formats=["png"]):
         """TODO: Docstring for plot_all_profiles.
 
         Parameters
@@ -601,76 +758,79 @@ class Plotter():
         {BS, DISP, BSDISP} : boolean, default True, True, False
             Use them as error estimation
         plot_save : boolean, default False
-            Either or not saving the plot
+            Either or not saving the plot (the figure is closed afterwards)
         savedir : str
             Path to save the plot
+        formats : list of str, default ["png"]
+            Format of the saved figures. With "pdf", all the profiles are
+            saved as the pages of a single "<site>_all_profiles.pdf" file.
 
         """
         pmf = self.pmf
 
+        need = ["profiles", "meta", "contrib"]
+        if BS:
+            need.append("BS")
+        if DISP:
+            need.append("DISP")
+        self._ensure_loaded(constrained=constrained, need=need)
+
         if profiles is None:
-            if pmf.profiles is None:
-                pmf.read.read_metadata()
             profiles = pmf.profiles
 
         if BS:
-            if constrained:
-                if pmf.dfBS_profile_c is None:
-                    pmf.read.read_constrained_bootstrap()
-                dfBS = pmf.dfBS_profile_c
-            else:
-                if pmf.dfBS_profile_b is None:
-                    pmf.read.read_base_bootstrap()
-                dfBS = pmf.dfBS_profile_b
+            dfBS = pmf.dfBS_profile_c if constrained else pmf.dfBS_profile_b
+            # mask the zeros once for all the profiles
+            dfBS_nz = dfBS.where(dfBS != 0)
         else:
             dfBS = None
+            dfBS_nz = None
 
         if DISP:
-            if constrained:
-                if pmf.df_uncertainties_summary_c is None:
-                    pmf.read.read_constrained_uncertainties_summary()
-                dfDISP = pmf.df_uncertainties_summary_c[["DISP Min", "DISP Max"]]
-            else:
-                if pmf.df_uncertainties_summary_b is None:
-                    pmf.read.read_base_uncertainties_summary()
-                dfDISP = pmf.df_uncertainties_summary_b[["DISP Min", "DISP Max"]]
+            dfDISP = pmf.df_uncertainties_summary_c if constrained \
+                    else pmf.df_uncertainties_summary_b
+            dfDISP = dfDISP[["DISP Min", "DISP Max"]]
         else:
             dfDISP = None
 
-        if constrained:
-            if pmf.dfcontrib_c is None:
-                pmf.read.read_constrained_contributions()
-            dfcontrib = pmf.dfcontrib_c
-        else:
-            if pmf.dfcontrib_b is None:
-                pmf.read.read_base_contributions()
-            dfcontrib = pmf.dfcontrib_b
-
-        if constrained:
-            if pmf.dfprofiles_c is None:
-                pmf.read.read_constrained_profiles()
-        else:
-            if pmf.dfprofiles_b is None:
-                pmf.read.read_base_profiles()
+        dfcontrib = pmf.dfcontrib_c if constrained else pmf.dfcontrib_b
 
         if specie is None:
-            if pmf.totalVar is None:
-                pmf.read.read_metadata()
             specie = pmf.totalVar
 
         if savedir is None:
             savedir = self.savedir
 
-        for p in profiles:
-            self._plot_profile(
-                constrained=constrained, dfcontrib=dfcontrib, dfBS=dfBS, dfDISP=dfDISP, profile=p,
-                specie=specie, BS=BS, DISP=DISP, BSDISP=BSDISP
-            )
-            if plot_save:
-                self._save_plot(
-                    DIR=savedir,
-                    name=pmf._site+"_"+p+"_contribution_and_profiles"
+        # when only saving, draw every profile on the same figure
+        fig = plt.figure(figsize=(12, 12)) if plot_save else None
+
+        pdf = None
+        if plot_save and "pdf" in formats:
+            pdf = PdfPages("{}{}_all_profiles.pdf".format(savedir, pmf._site))
+            formats = [fmt for fmt in formats if fmt != "pdf"]
+
+        try:
+            for p in profiles:
+                fig = self._plot_profile(
+                    constrained=constrained, dfcontrib=dfcontrib, dfBS=dfBS, dfDISP=dfDISP, profile=p,
+                    specie=specie, BS=BS, DISP=DISP, BSDISP=BSDISP, fig=fig,
+                    dfBS_nz=dfBS_nz
                 )
+                if plot_save:
+                    self._save_plot(
+                        formats=formats,
+                        DIR=savedir,
+                        name=pmf._site+"_"+p+"_contribution_and_profiles",
+                        dpi=_RASTER_DPI
+                    )
+                    if pdf is not None:
+                        pdf.savefig(fig, dpi=_RASTER_DPI)
+        finally:
+            if pdf is not None:
+                pdf.close()
+
+        if plot_save:
+            plt.close(fig)
 
     def plot_stacked_contributions(self, constrained=True, order=None, plot_kwargs=None,
             savedir=None, plot_save=False):
@@ -697,10 +857,8 @@ class Plotter():
                 df = df.reindex(sorted(df.columns), axis=1)
         labels = df.columns
 
-        y = np.vstack(df.values).T
-        colors = [
-            get_sourceColor(c) for c in labels #get_sourcesCategories(labels)
-        ]
+        y = df.to_numpy().T
+        colors = get_sourceColor(list(labels))
         
         fig, ax = plt.subplots(figsize=(14, 4))
         ax.stackplot(df.index, y, colors=colors, labels=labels)
@@ -754,34 +912,18 @@ class Plotter():
         """
         pmf = self.pmf
 
+        self._ensure_loaded(constrained=constrained, need=("profiles", "contrib", "meta"))
+
         if dfcontrib is None:
-            if constrained:
-                if pmf.dfcontrib_c is None:
-                    pmf.read.read_constrained_contributions()
-                dfcontrib = pmf.dfcontrib_c
-            else:
-                if pmf.dfcontrib_b is None:
-                    pmf.read.read_base_contributions()
-                dfcontrib = pmf.dfcontrib_b
+            dfcontrib = pmf.dfcontrib_c if constrained else pmf.dfcontrib_b
 
         if dfprofiles is None:
-            if constrained:
-                if pmf.dfprofiles_c is None:
-                    pmf.read.read_constrained_profiles()
-                dfprofiles = pmf.dfprofiles_c
-            else:
-                if pmf.dfprofiles_b is None:
-                    pmf.read.read_base_profiles()
-                dfprofiles = pmf.dfprofiles_b
+            dfprofiles = pmf.dfprofiles_c if constrained else pmf.dfprofiles_b
 
         if profiles is None:
-            if pmf.profiles is None:
-                pmf.read.read_metadata()
             profiles = pmf.profiles
 
         if specie is None:
-            if pmf.totalVar is None:
-                pmf.read.read_metadata()
             specie = pmf.totalVar
 
         if savedir is None:
@@ -794,7 +936,7 @@ class Plotter():
                                             annual=annual,
                                            constrained=constrained)
 
-        colors = [get_sourceColor(c) for c in df.columns]
+        colors = get_sourceColor(list(df.columns))
 
         df.index = [l.replace("_", " ") for l in df.index]
         axes = df.plot.bar(
@@ -848,10 +990,10 @@ class Plotter():
 
         df = df.sort_index(axis=1)
 
-        colors = [get_sourceColor(c) for c in df.columns]
+        colors = get_sourceColor(list(df.columns))
 
         fig, ax = plt.subplots(1, 1, figsize=(12, 4))
-        df.plot(kind="bar", stacked=True, color=colors, ax=ax)
+        self._plot_stacked_bar(df, ax=ax, colors=colors)
 
         xticklabels = [t.get_text() for t in ax.get_xticklabels()]
         ax.set_xticklabels(pretty_specie(xticklabels), rotation=90)
@@ -906,16 +1048,11 @@ class Plotter():
         if normalize:
             df = (df.T / df.sum(axis=1)).T
 
-        colors = get_sourceColor()[df.columns].loc["color"].to_dict()
+        colors = {c: _SOURCE_COLORS[c] for c in df.columns}
 
         fig, ax = plt.subplots(1, 1, figsize=(5, 4))
 
-        df.plot(
-                kind="bar",
-                stacked=True,
-                color=colors,
-                ax=ax
-                )
+        self._plot_stacked_bar(df, ax=ax, colors=[colors[c] for c in df.columns])
 
         ax.legend(
                 loc="center left",
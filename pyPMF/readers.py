@@ -1,10 +1,83 @@
 from abc import ABC, abstractmethod
+import importlib.util
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 
-XLSX_ENGINE = "xlrd"
+# calamine (python-calamine) is much faster to parse the xlsx files, openpyxl
+# is the fallback (pandas already opens it in read-only mode). Only look for
+# the package here, pandas imports the engine at the first read_excel.
+if importlib.util.find_spec("python_calamine") is not None:
+    XLSX_ENGINE = "calamine"
+else:
+    XLSX_ENGINE = "openpyxl"
+
+
+def _find_rows(col, marker):
+    """Return the positions of the rows of `col` whose text contains
+    `marker` (literally). Non-string cells never match.
+
+    The sheets are read without header, so the positions are also the index
+    labels.
+    """
+    values = col.to_numpy(dtype=object)
+    mask = np.fromiter(
+        (isinstance(v, str) and marker in v for v in values),
+        dtype=bool, count=len(values)
+    )
+    return np.flatnonzero(mask).tolist()
+
+
+def _drop_after_nan_column(df):
+    """Keep only the columns of `df` before its first all-NaN column (the
+    separator between the table and the next one in the sheet).
+
+    The columns are checked from the left and the search stops at the first
+    empty one, so the cells after it are never looked at.
+    """
+    first = next(
+        (j for j in range(df.shape[1]) if df.iloc[:, j].isna().all()), None
+    )
+    if first is not None:
+        df = df.iloc[:, :first]
+    return df
+
+
+# header lines inside the error estimation summary tables
+_SUMMARY_HEADER = re.compile("Specie|Concentration")
+
+
+# outputs read by read_all after the base profiles. Readers of the same file
+# are in the same group, so that a workbook is never parsed by two threads.
+_READ_ALL_GROUPS = [
+    ["read_base_contributions"],
+    ["read_base_bootstrap"],
+    ["read_base_uncertainties_summary"],
+    ["read_constrained_profiles", "read_constrained_contributions"],
+    ["read_constrained_bootstrap"],
+    ["read_constrained_uncertainties_summary"],
+]
+
+
+# file read by each XlsxReader.read_* method, after the site prefix
+_XLSX_FILES = {
+    "read_base_profiles": "_base.xlsx",
+    "read_base_contributions": "_base.xlsx",
+    "read_base_bootstrap": "_boot.xlsx",
+    "read_base_uncertainties_summary": "_BaseErrorEstimationSummary.xlsx",
+    "read_constrained_profiles": "_Constrained.xlsx",
+    "read_constrained_contributions": "_Constrained.xlsx",
+    "read_constrained_bootstrap": "_Gcon_profile_boot.xlsx",
+    "read_constrained_uncertainties_summary": "_ConstrainedErrorEstimationSummary.xlsx",
+}
+
 
 class BaseReader(ABC):
+    # number of threads used by read_all (a SQL connection can not be shared
+    # between threads)
+    max_workers = 1
 
     def __init__(self, site, pmf):
         self.site = site
@@ -107,18 +180,16 @@ class BaseReader(ABC):
             convergent BS (≠ than unmapped))
         """
         # handle nonconvergente BS
-        nBSconverged = dfbootstrap_mapping.sum(axis=1)[0]
+        nBSconverged = dfbootstrap_mapping.sum(axis=1).iloc[0]
         nBSnotconverged = len(dfBS_profile.columns)-1-nBSconverged
         if nBSnotconverged > 0:
             print("Warging: trying to exclude non-convergente BS")
-            idxStrange = (dfBS_profile.loc[self.pmf.totalVar]>100)
-            colStrange = dfBS_profile[idxStrange]\
-                    .dropna(axis=1, how="all")\
-                    .dropna(how="all")\
-                    .columns
+            # BS with a total variable > 100 for any of the profiles
+            totalVar = dfBS_profile.loc[self.pmf.totalVar].to_numpy(dtype=float)
+            colStrange = dfBS_profile.columns[(totalVar > 100).any(axis=0)]
             print("BS eliminated:")
             print(dfBS_profile[colStrange])
-            dfBS_profile = dfBS_profile.drop(colStrange, axis=1)
+            dfBS_profile.drop(columns=colStrange, inplace=True)
 
         # handle BS without totalVariable
         # if self.pmf.totalVar:
@@ -144,33 +215,40 @@ class BaseReader(ABC):
         pmf.profiles = pmf.dfprofiles_b.columns.tolist()
         pmf.nprofiles = len(pmf.profiles)
         pmf.species = pmf.dfprofiles_b.index.tolist()
+        pmf._species_set = set(pmf.species)
         pmf.nspecies = len(pmf.species)
 
+        # the last one of TOTALVAR present in the species wins
         TOTALVAR = ["PM10", "PM2.5", "PMrecons", "PM10rec", "PM10recons"]
-        for x in TOTALVAR:
-            if x in pmf.species:
-                pmf.totalVar = x
+        totalVar = next(
+            (x for x in reversed(TOTALVAR) if x in pmf._species_set), None
+        )
+        if totalVar is not None:
+            pmf.totalVar = totalVar
         if pmf.totalVar is None:
             print("Warning: trying to guess total variable.")
-            pmf.totalVar = [x for x in pmf.species if "PM" in x]
-            if len(pmf.totalVar) >= 1:
-                print("Warning: several possible total variable: {}".format(pmf.totalVar))
-                print("Watning: taking the first one {}".format(pmf.totalVar[0]))
-            pmf.totalVar = pmf.totalVar[0]
+            totalVar = next((x for x in pmf.species if "PM" in x), None)
+            if totalVar is None:
+                raise ValueError("no total variable found in species")
+            pmf.totalVar = totalVar
+            print("Warning: taking the first specie with PM in its name: {}".format(pmf.totalVar))
         print("Total variable set to: {}".format(pmf.totalVar))
 
-    def read_all(self):
-        """Read all possible data outputed by the PMF
-
-        :returns: TODO
+    def close(self):
+        """Release the resources held by the reader, if any."""
+        pass
 
-        """
+    def _has_output(self, reader):
+        """Whether the output read by the read_* method `reader` exists.
+        Cheap check done by read_all before calling the reader."""
+        return True
 
-        pmf = self.pmf
-        for reader in ["read_base_profiles", "read_base_contributions",
-                "read_base_bootstrap", "read_base_uncertainties_summary",
-                "read_constrained_profiles", "read_constrained_contributions",
-                "read_constrained_bootstrap", "read_constrained_uncertainties_summary"]:
+    def _read_group(self, readers):
+        """Run the given read_* methods one after the other"""
+        for reader in readers:
+            if not self._has_output(reader):
+                print("The file is not found for {}".format(reader))
+                continue
             try:
                 getattr(self, reader)()
             except FileNotFoundError:
@@ -178,11 +256,47 @@ class BaseReader(ABC):
             except Exception as a:
                 raise Exception(f"Error while reading {reader}: {a}")
 
+    def read_all(self):
+        """Read all possible data outputed by the PMF
+
+        The base profiles are read first (they give the profiles and species
+        names), then the other outputs are read concurrently by
+        `max_workers` threads. The resources kept by the reader (opened
+        workbooks) are released at the end.
+
+        :returns: TODO
+
+        """
+        try:
+            self._read_group(["read_base_profiles"])
+
+            if self.max_workers > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [
+                        executor.submit(self._read_group, readers)
+                        for readers in _READ_ALL_GROUPS
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                for readers in _READ_ALL_GROUPS:
+                    self._read_group(readers)
+        finally:
+            # everything is read, no need to keep the files open
+            self.close()
+
 
 class XlsxReader(BaseReader):
     """
     Accessor class for the PMF class with all reader methods.
+
+    The workbooks are kept open between the read_* calls (a workbook
+    modified on disk since is re-opened). read_all releases them at the end;
+    when calling the read_* methods directly, call `close()` once done so
+    that the files are not held open (e.g. for the PMF software to overwrite
+    them on Windows).
     """
+    max_workers = 4
 
     def __init__(self, BDIR, site, pmf):
         super().__init__(site=site, pmf=pmf)
@@ -190,6 +304,68 @@ class XlsxReader(BaseReader):
         self.BDIR = BDIR
         self.basename = BDIR + self.site
 
+        # path -> (modification time, pd.ExcelFile), so that each workbook is
+        # parsed only once as long as it is not modified
+        self._xlsx_cache = {}
+        # (sheet, marker) -> number of rows up to the 2nd marker, shared by the
+        # base and constrained files which have the same layout
+        self._block_nrows = {}
+
+    def _read_sheet(self, path, sheet_name, **kwargs):
+        """Read a whole sheet (without header) of the workbook `path`.
+
+        The workbook is opened once and kept in cache for the other sheets
+        and the next calls, unless the file has been modified since.
+        """
+        mtime = os.path.getmtime(path)
+        cached = self._xlsx_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            if cached is not None:
+                cached[1].close()
+            cached = (mtime, pd.ExcelFile(path, engine=XLSX_ENGINE))
+            self._xlsx_cache[path] = cached
+        return cached[1].parse(sheet_name, header=None, **kwargs)
+
+    def _read_first_block(self, path, sheet_name, marker, **kwargs):
+        """Read a sheet up to the second row whose first column contains
+        `marker`.
+
+        The first call reads the whole sheet and remembers where the second
+        marker is; the next files with the same sheet only read these rows
+        (`nrows`), and fall back to the whole sheet if the marker is not
+        found in them.
+
+        Returns
+        -------
+
+        df : pd.DataFrame
+            The sheet
+        idx : list of int
+            The rows of the marker
+        """
+        key = (sheet_name, marker)
+        nrows = self._block_nrows.get(key)
+
+        df = self._read_sheet(path, sheet_name, nrows=nrows, **kwargs)
+        idx = _find_rows(df.iloc[:, 0], marker)
+
+        if nrows is not None and len(idx) < 2:
+            df = self._read_sheet(path, sheet_name, **kwargs)
+            idx = _find_rows(df.iloc[:, 0], marker)
+        if len(idx) >= 2:
+            self._block_nrows[key] = idx[1] + 1
+        return df, idx
+
+    def _has_output(self, reader):
+        return os.path.isfile(self.basename + _XLSX_FILES[reader])
+
+    def close(self):
+        """Release the workbooks kept open by the reader. To call after
+        reading the outputs with the read_* methods directly (read_all already
+        does it)."""
+        for _, xl in self._xlsx_cache.values():
+            xl.close()
+        self._xlsx_cache.clear()
 
     def _split_df_by_nan(self, df):
         """Internet method the read the bootstrap file format:
@@ -204,18 +380,19 @@ class XlsxReader(BaseReader):
         Return
         ------
 
-        pd.DataFrame, formatted by factor and species
+        pd.DataFrame, with a (Specie, Profile) multiindex and one Boot column per
+        bootstrap run
 
         """
         pmf = self.pmf
-        d = {}
-        dftmp = df.dropna()
-        for i, sp in enumerate(pmf.species):
-            d[sp] = dftmp.iloc[pmf.nprofiles*i:pmf.nprofiles*(i+1), :]
-            d[sp].index = pmf.profiles
-            d[sp].index.name = "Profile"
-            d[sp].columns = ["Boot{}".format(i) for i in range(len(d[sp].columns))]
-        return d
+        # once the empty lines removed, the blocks are just stacked one after
+        # the other, in the species then profiles order
+        values = df.dropna().to_numpy()[:pmf.nspecies*pmf.nprofiles]
+        index = pd.MultiIndex.from_product(
+            [pmf.species, pmf.profiles], names=["Specie", "Profile"]
+        )
+        columns = ["Boot{}".format(i) for i in range(values.shape[1])]
+        return pd.DataFrame(values, index=index, columns=columns)
 
 
     def read_base_profiles(self):
@@ -227,15 +404,11 @@ class XlsxReader(BaseReader):
         """
         pmf = self.pmf
 
-        dfbase = pd.read_excel(
+        dfbase, idx = self._read_first_block(
                 self.basename+"_base.xlsx",
-                sheet_name=['Profiles'],
-                header=None,
-                engine=XLSX_ENGINE
-                )["Profiles"]
-
-        idx = dfbase.iloc[:, 0].str.contains("Factor Profiles").fillna(False)
-        idx = idx[idx].index.tolist()
+                'Profiles',
+                "Factor Profiles"
+                )
 
         dfbase = dfbase.iloc[idx[0]:idx[1], 1:]
         dfbase.dropna(axis=0, how="all", inplace=True)
@@ -251,8 +424,9 @@ class XlsxReader(BaseReader):
             dfbase = dfbase.iloc[:, :idx]
             dfbase.dropna(how="all", inplace=True)
         # avoid 10**-12 possible concentration...
-        dfbase = dfbase.infer_objects()
-        dfbase[dfbase < 10e-6] = 0
+        values = dfbase.to_numpy(dtype=float)
+        np.putmask(values, values < 10e-6, 0)
+        dfbase = pd.DataFrame(values, index=dfbase.index, columns=dfbase.columns)
 
         pmf.dfprofiles_b = dfbase
 
@@ -270,15 +444,11 @@ class XlsxReader(BaseReader):
         if pmf.profiles is None:
             self.read_base_profiles()
 
-        dfcons = pd.read_excel(
+        dfcons, idx = self._read_first_block(
                     self.basename+"_Constrained.xlsx",
-                    sheet_name=['Profiles'],
-                    header=None,
-                    engine=XLSX_ENGINE
-                )["Profiles"]
-
-        idx = dfcons.iloc[:, 0].str.contains("Factor Profiles").fillna(False)
-        idx = idx[idx].index.tolist()
+                    'Profiles',
+                    "Factor Profiles"
+                )
 
         dfcons = dfcons.iloc[idx[0]:idx[1], 1:]
         dfcons.dropna(axis=0, how="all", inplace=True)
@@ -288,17 +458,15 @@ class XlsxReader(BaseReader):
         if idx > 0:
             dfcons = dfcons.iloc[:, :idx]
             dfcons.dropna(how="all", inplace=True)
-        nancolumns = dfcons.isna().all()
-        if nancolumns.any():
-            dfcons = dfcons.loc[:, :nancolumns.idxmax()]
-            dfcons.dropna(axis=1, how="all", inplace=True)
+        dfcons = _drop_after_nan_column(dfcons)
 
         dfcons.columns = ["Specie"] + pmf.profiles
         dfcons = dfcons.set_index("Specie")
         dfcons = dfcons[dfcons.index.notnull()]
         # avoid 10**-12 possible concentration...
-        dfcons = dfcons.infer_objects()
-        dfcons[dfcons < 10e-6] = 0
+        values = dfcons.to_numpy(dtype=float)
+        np.putmask(values, values < 10e-6, 0)
+        dfcons = pd.DataFrame(values, index=dfcons.index, columns=dfcons.columns)
 
         pmf.dfprofiles_c = dfcons
 
@@ -314,22 +482,18 @@ class XlsxReader(BaseReader):
         if pmf.profiles is None:
             self.read_base_profiles()
 
-        dfcontrib = pd.read_excel(
+        dfcontrib, idx = self._read_first_block(
             self.basename+"_base.xlsx",
-            sheet_name=['Contributions'],
+            'Contributions',
+            "Factor Contributions",
             parse_dates=[1],
-            header=None,
-            engine=XLSX_ENGINE
-        )["Contributions"]
+        )
 
-        try:
-            idx = dfcontrib.iloc[:, 0].str.contains("Factor Contributions").fillna(False)
-            idx = idx[idx].index.tolist()
-            if len(idx) > 1:
-                dfcontrib = dfcontrib.iloc[idx[0]:idx[1], :]
-            else:
-                dfcontrib = dfcontrib.iloc[idx[0]+1:, :]
-        except AttributeError:
+        if len(idx) > 1:
+            dfcontrib = dfcontrib.iloc[idx[0]:idx[1], :]
+        elif len(idx) == 1:
+            dfcontrib = dfcontrib.iloc[idx[0]+1:, :]
+        else:
             print("WARNING: no total PM reconstructed in the file")
 
         dfcontrib.dropna(axis=1, how="all", inplace=True)
@@ -341,7 +505,7 @@ class XlsxReader(BaseReader):
 
         dfcontrib.replace({-999: np.nan}, inplace=True)
 
-        pmf.dfcontrib_b = dfcontrib
+        pmf.dfcontrib_b = dfcontrib.astype(float)
 
     def read_constrained_contributions(self):
         """Read the "constrained" contributions result from the file: '_Constrained.xlsx',
@@ -355,33 +519,26 @@ class XlsxReader(BaseReader):
         if pmf.profiles is None:
             self.read_base_profiles()
 
-        dfcontrib = pd.read_excel(
+        dfcontrib, idx = self._read_first_block(
             self.basename+"_Constrained.xlsx",
-            sheet_name=['Contributions'],
+            'Contributions',
+            "Factor Contributions",
             parse_dates=[1],
-            header=None,
-            engine=XLSX_ENGINE
-        )["Contributions"]
-
-        idx = dfcontrib.iloc[:, 0].str.contains("Factor Contributions").fillna(False)
-        idx = idx[idx].index.tolist()
+        )
 
         if len(idx) > 1:
             dfcontrib = dfcontrib.iloc[idx[0]+1:idx[1], 1:]
         else:
             dfcontrib = dfcontrib.iloc[idx[0]+1:, 1:]
 
-        nancolumns = dfcontrib.isna().all()
-        if nancolumns.any():
-            dfcontrib = dfcontrib.loc[:, :nancolumns.idxmax()]
-        dfcontrib.dropna(axis=0, how="all", inplace=True)
-        dfcontrib.dropna(axis=1, how="all", inplace=True)
+        dfcontrib = _drop_after_nan_column(dfcontrib)
+        dfcontrib = dfcontrib.dropna(axis=0, how="all")
         dfcontrib.columns = ["Date"] + pmf.profiles
         dfcontrib.replace({-999: np.nan}, inplace=True)
         dfcontrib.set_index("Date", inplace=True)
         dfcontrib = dfcontrib[dfcontrib.index.notnull()]
 
-        pmf.dfcontrib_c = dfcontrib.infer_objects()
+        pmf.dfcontrib_c = dfcontrib.astype(float)
 
     def read_base_bootstrap(self):
         """Read the "base" bootstrap result from the file: '_boot.xlsx'
@@ -396,28 +553,22 @@ class XlsxReader(BaseReader):
         if pmf.profiles is None:
             self.read_base_profiles()
 
-        dfprofile_boot = pd.read_excel(
+        dfprofile_boot = self._read_sheet(
             self.basename+"_boot.xlsx",
-            sheet_name=['Profiles'],
-            header=None,
-            engine=XLSX_ENGINE
-        )["Profiles"]
+            'Profiles',
+        )
 
         dfbootstrap_mapping_b = dfprofile_boot.iloc[2:2+pmf.nprofiles, 0:pmf.nprofiles+2]
         dfbootstrap_mapping_b.columns = ["mapped"] + pmf.profiles + ["unmapped"]
         dfbootstrap_mapping_b.set_index("mapped", inplace=True)
         dfbootstrap_mapping_b.index = ["BF-"+f for f in pmf.profiles]
 
-        idx = dfprofile_boot.iloc[:, 0].str.contains("Columns are:").fillna(False)
-        idx = idx[idx].index.tolist()
+        idx = _find_rows(dfprofile_boot.iloc[:, 0], "Columns are:")
 
         # 13 is the first column for BS result
         dfprofile_boot = dfprofile_boot.iloc[idx[0]+1:, 13:]
         dfBS_profile_b = self._split_df_by_nan(dfprofile_boot)
 
-        dfBS_profile_b = pd.concat(dfBS_profile_b)
-        dfBS_profile_b.index.names = ["Specie", "Profile"]
-
         self._handle_non_convergente_bootstrap(dfBS_profile_b, dfbootstrap_mapping_b)
 
         pmf.dfBS_profile_b = dfBS_profile_b
@@ -436,37 +587,47 @@ class XlsxReader(BaseReader):
         if pmf.profiles is None:
             self.read_base_profiles()
 
-        dfprofile_boot = pd.read_excel(
+        dfprofile_boot = self._read_sheet(
             self.basename+"_Gcon_profile_boot.xlsx",
-            sheet_name=['Profiles'],
-            header=None,
-            engine=XLSX_ENGINE
-        )["Profiles"]
+            'Profiles',
+        )
 
         dfbootstrap_mapping_c = dfprofile_boot.iloc[2:2+pmf.nprofiles, 0:pmf.nprofiles+2]
         dfbootstrap_mapping_c.columns = ["mapped"] + pmf.profiles + ["unmapped"]
         dfbootstrap_mapping_c.set_index("mapped", inplace=True)
         dfbootstrap_mapping_c.index = ["BF-"+f for f in pmf.profiles]
 
-        idx = dfprofile_boot.iloc[:, 0].str.contains("Columns are:").fillna(False)
-        idx = idx[idx].index.tolist()
+        idx = _find_rows(dfprofile_boot.iloc[:, 0], "Columns are:")
         # 13 is the first column for BS result
         dfprofile_boot = dfprofile_boot.iloc[idx[0]+1:, 13:]
         dfBS_profile_c = self._split_df_by_nan(dfprofile_boot)
 
-        dfBS_profile_c = pd.concat(dfBS_profile_c)
-        dfBS_profile_c.index.names = ["Specie", "Profile"]
-
         self._handle_non_convergente_bootstrap(dfBS_profile_c, dfbootstrap_mapping_c)
 
         pmf.dfBS_profile_c = dfBS_profile_c
         pmf.dfbootstrap_mapping_c = dfbootstrap_mapping_c
 
-    def read_base_uncertainties_summary(self):
-        """Read the _BaseErrorEstimationSummary.xlsx file and add:
+    def _parse_uncertainties_summary(self, path, sheet_name, columns):
+        """Read an error estimation summary file. The base and constrained
+        files have the same layout but not the same columns.
 
-        - self.df_uncertainties_summary_b : uncertainties from BS, DISP and BS-DISP
+        Parameters
+        ----------
+
+        path : str
+            The xlsx file
+        sheet_name : str
+        columns : list of str
+            Name of the columns of the summary table, with "Specie", "tmp1" and
+            "tmp2" for the columns to drop
 
+        Returns
+        -------
+
+        df_disp_swap : pd.DataFrame or None
+            DISP swap count per profile, None if not in the file
+        df : pd.DataFrame
+            Uncertainties summary, with a (Profile, Specie) multiindex
         """
         pmf = self.pmf
 
@@ -476,118 +637,88 @@ class XlsxReader(BaseReader):
         if pmf.species is None:
             self.read_base_profiles()
 
-        rawdf = pd.read_excel(
-            self.basename+"_BaseErrorEstimationSummary.xlsx",
-            sheet_name=["Error Estimation Summary"],
-            header=None,
-            engine=XLSX_ENGINE
-            )["Error Estimation Summary"]
+        rawdf = self._read_sheet(path, sheet_name)
         rawdf = rawdf.dropna(axis=0, how="all").reset_index()
         if "index" in rawdf.columns:
             rawdf = rawdf.drop("index", axis=1)
 
-
         # ==== DISP swap
-        idx = rawdf.iloc[:, 1].str.contains("Swaps").fillna(False)
-        if idx.sum() > 0:
-            df = pd.DataFrame()
-            df = rawdf.loc[idx, :]\
+        df_disp_swap = None
+        idx = _find_rows(rawdf.iloc[:, 1], "Swaps")
+        if len(idx) > 0:
+            df_disp_swap = rawdf.loc[idx, :]\
                     .dropna(axis=1)\
                     .iloc[:, 1:]\
                     .reset_index(drop=True)
-            df.columns = pmf.profiles
-            df.index = ["swap count"]
-
-            pmf.df_disp_swap_b = df
+            df_disp_swap.columns = pmf.profiles
+            df_disp_swap.index = ["swap count"]
 
         # ==== uncertainties summary
         # get only the correct rows
-        idx = rawdf.iloc[:, 0].str.contains("Concentrations for").astype(bool)
-        idx = rawdf.loc[idx]\
-                .iloc[:, 0]\
-                .dropna()\
-                .index
-        df = pd.DataFrame()
-        df = rawdf.loc[idx[0]+1:idx[-1]+1+pmf.nspecies, :]
-        idx = df.iloc[:, 0].str.contains("Specie|Concentration").astype(bool)
-        df = df.drop(idx[idx].index)
+        # a single scan of the first column gives both the header lines of
+        # the blocks (or non-text cells) and the "Concentrations for" ones
+        col0 = rawdf.iloc[:, 0].to_numpy(dtype=object)
+        is_header = np.fromiter(
+            (not isinstance(v, str) or _SUMMARY_HEADER.search(v) is not None
+             for v in col0),
+            dtype=bool, count=len(col0)
+        )
+        idx = [i for i in np.flatnonzero(is_header)
+               if isinstance(col0[i], str) and "Concentrations for" in col0[i]]
+        rows = slice(idx[0]+1, idx[-1]+2+pmf.nspecies)
+        df = rawdf.iloc[rows][~is_header[rows]]
         df = df.dropna(axis=0, how='all')
-        df["Profile"] = np.repeat(pmf.profiles, len(pmf.species)).tolist()
-
-        df.columns = ["Specie", "Base run", 
-                "BS 5th", "BS 25th", "BS median", "BS 75th", "BS 95th", "tmp1",
-                "BS-DISP 5th", "BS-DISP average", "BS-DISP 95th", "tmp2",
-                "DISP Min", "DISP average", "DISP Max",
-                "Profile"
-                ]
-        df["Specie"] = pmf.species * len(pmf.profiles)
-        df.set_index(["Profile", "Specie"], inplace=True)
-        df.drop(["tmp1", "tmp2"], axis=1, inplace=True)
+        df.columns = columns
+        df = df.drop(["Specie", "tmp1", "tmp2"], axis=1)
+        # one block of species per profile
+        index = pd.MultiIndex.from_product(
+            [pmf.profiles, pmf.species], names=["Profile", "Specie"]
+        )
+        df = pd.DataFrame(df.to_numpy(dtype=float), index=index, columns=df.columns)
 
-        pmf.df_uncertainties_summary_b = df.infer_objects()
+        return df_disp_swap, df
 
-    def read_constrained_uncertainties_summary(self):
-        """Read the _ConstrainedErrorEstimationSummary.xlsx file and add :
+    def read_base_uncertainties_summary(self):
+        """Read the _BaseErrorEstimationSummary.xlsx file and add:
 
         - self.df_uncertainties_summary_b : uncertainties from BS, DISP and BS-DISP
 
         """
         pmf = self.pmf
 
-        if pmf.profiles is None:
-            self.read_base_profiles()
-
-        if pmf.species is None:
-            self.read_base_profiles()
+        df_disp_swap, df = self._parse_uncertainties_summary(
+            self.basename+"_BaseErrorEstimationSummary.xlsx",
+            "Error Estimation Summary",
+            ["Specie", "Base run",
+             "BS 5th", "BS 25th", "BS median", "BS 75th", "BS 95th", "tmp1",
+             "BS-DISP 5th", "BS-DISP average", "BS-DISP 95th", "tmp2",
+             "DISP Min", "DISP average", "DISP Max"]
+        )
+        if df_disp_swap is not None:
+            pmf.df_disp_swap_b = df_disp_swap
 
-        rawdf = pd.read_excel(
-            self.basename+"_ConstrainedErrorEstimationSummary.xlsx",
-            sheet_name=["Constrained Error Est. Summary"],
-            header=None,
-            engine=XLSX_ENGINE
-            )["Constrained Error Est. Summary"]
-        rawdf = rawdf.dropna(axis=0, how="all").reset_index()
-        if "index" in rawdf.columns:
-            rawdf = rawdf.drop("index", axis=1)
+        pmf.df_uncertainties_summary_b = df
 
-        # ==== DISP swap
-        idx = rawdf.iloc[:, 1].str.contains("Swaps").fillna(False)
-        if idx.sum() > 0:
-            df = pd.DataFrame()
-            df = rawdf.loc[idx, :]\
-                    .dropna(axis=1)\
-                    .iloc[:, 1:]\
-                    .reset_index(drop=True)
-            df.columns = pmf.profiles
-            df.index = ["swap count"]
+    def read_constrained_uncertainties_summary(self):
+        """Read the _ConstrainedErrorEstimationSummary.xlsx file and add :
 
-            pmf.df_disp_swap_c = df
+        - self.df_uncertainties_summary_b : uncertainties from BS, DISP and BS-DISP
 
-        # ==== uncertainties summary
-        # get only the correct rows
-        idx = rawdf.iloc[:, 0].str.contains("Concentrations for").astype(bool)
-        idx = rawdf.loc[idx]\
-                .iloc[:, 0]\
-                .dropna()\
-                .index
-        df = pd.DataFrame()
-        df = rawdf.loc[idx[0]+1:idx[-1]+1+pmf.nspecies, :]
-        idx = df.iloc[:, 0].str.contains("Specie|Concentration").astype(bool)
-        df = df.drop(idx[idx].index)
-        df = df.dropna(axis=0, how='all')
-        df["Profile"] = np.repeat(pmf.profiles, len(pmf.species)).tolist()
+        """
+        pmf = self.pmf
 
-        df.columns = ["Specie", "Constrained base run",
-                "BS 5th", "BS median", "BS 95th", "tmp1",
-                "BS-DISP 5th", "BS-DISP average", "BS-DISP 95th", "tmp2",
-                "DISP Min", "DISP average", "DISP Max",
-                "Profile"
-                ]
-        df["Specie"] = pmf.species * len(pmf.profiles)
-        df.set_index(["Profile", "Specie"], inplace=True)
-        df.drop(["tmp1", "tmp2"], axis=1, inplace=True)
+        df_disp_swap, df = self._parse_uncertainties_summary(
+            self.basename+"_ConstrainedErrorEstimationSummary.xlsx",
+            "Constrained Error Est. Summary",
+            ["Specie", "Constrained base run",
+             "BS 5th", "BS median", "BS 95th", "tmp1",
+             "BS-DISP 5th", "BS-DISP average", "BS-DISP 95th", "tmp2",
+             "DISP Min", "DISP average", "DISP Max"]
+        )
+        if df_disp_swap is not None:
+            pmf.df_disp_swap_c = df_disp_swap
 
-        pmf.df_uncertainties_summary_c = df.infer_objects()
+        pmf.df_uncertainties_summary_c = df
 
 
 class SqlReader(BaseReader):
@@ -643,12 +774,9 @@ class SqlReader(BaseReader):
         - self.dfprofiles_b: base factors profile
 
         """
-        df = self._read_table(table="dfprofiles_b")
+        df = self._read_table(table="dfprofiles_b", read_sql_kws=dict(index_col="Specie"))
 
-        df = df.dropna(axis=1, how='all')
-        df = df.set_index(["Specie"]).drop(["Program", "Station"], axis=1)
-        if "index" in df.columns:
-            df = df.drop("index", axis=1)
+        df = df.dropna(axis=1, how='all').drop(["Program", "Station"], axis=1)
 
         self.pmf.dfprofiles_b = df
 
@@ -660,12 +788,9 @@ class SqlReader(BaseReader):
         - self.dfprofiles_c: constrained factors profile
 
         """
-        df = self._read_table(table="dfprofiles_c")
+        df = self._read_table(table="dfprofiles_c", read_sql_kws=dict(index_col="Specie"))
 
-        df = df.dropna(axis=1, how='all')
-        df = df.set_index(["Specie"]).drop(["Program", "Station"], axis=1)
-        if "index" in df.columns:
-            df = df.drop("index", axis=1)
+        df = df.dropna(axis=1, how='all').drop(["Program", "Station"], axis=1)
 
         self.pmf.dfprofiles_c = df
 
@@ -677,11 +802,10 @@ class SqlReader(BaseReader):
         - self.dfcontrib_b: base factors contribution
 
         """
-        df = self._read_table(table="dfcontrib_b", read_sql_kws=dict(parse_dates="Date"))
-        df = df.dropna(axis=1, how='all')
-        df = df.set_index(["Date"]).drop(["Program", "Station"], axis=1)
-        if "index" in df.columns:
-            df = df.drop("index", axis=1)
+        df = self._read_table(
+            table="dfcontrib_b", read_sql_kws=dict(index_col="Date", parse_dates="Date")
+        )
+        df = df.dropna(axis=1, how='all').drop(["Program", "Station"], axis=1)
 
         self.pmf.dfcontrib_b = df
 
@@ -692,33 +816,29 @@ class SqlReader(BaseReader):
         - self.dfcontrib_c: constrained factors contribution
 
         """
-        df = self._read_table(table="dfcontrib_c", read_sql_kws=dict(parse_dates="Date"))
-        df = df.dropna(axis=1, how='all')
-        df = df.set_index(["Date"]).drop(["Program", "Station"], axis=1)
-        if "index" in df.columns:
-            df = df.drop("index", axis=1)
+        df = self._read_table(
+            table="dfcontrib_c", read_sql_kws=dict(index_col="Date", parse_dates="Date")
+        )
+        df = df.dropna(axis=1, how='all').drop(["Program", "Station"], axis=1)
 
         self.pmf.dfcontrib_c = df
 
     def _read_bootstrap(self, tableBS, table_mapping):
-        dfBS_profile = self._read_table(table=tableBS)
+        dfBS_profile = self._read_table(
+                table=tableBS, read_sql_kws=dict(index_col=["Specie", "Profile"])
+        )
         dfBS_profile = (
                 dfBS_profile
                 .dropna(axis=1, how='all')
-                .set_index(["Specie", "Profile"])
                 .drop(["Program", "Station"], axis=1)
         )
-        if "index" in dfBS_profile.columns:
-            dfBS_profile = dfBS_profile.drop("index", axis=1)
 
-        dfBS_profile = dfBS_profile.reindex(
-                ["Boot{}".format(i) for i in range(0, len(dfBS_profile.columns))],
-                axis=1
-                )
+        # the table usually already has the Boot columns in order
+        boot_columns = ["Boot{}".format(i) for i in range(0, len(dfBS_profile.columns))]
+        if dfBS_profile.columns.tolist() != boot_columns:
+            dfBS_profile = dfBS_profile.reindex(boot_columns, axis=1)
 
         dfbootstrap_mapping = self._read_table(table=table_mapping)
-        if "index" in dfbootstrap_mapping.columns:
-            dfbootstrap_mapping = dfbootstrap_mapping.drop("index", axis=1)
         dfbootstrap_mapping = (
                 dfbootstrap_mapping
                 .dropna(axis=1, how="all")
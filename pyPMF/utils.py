@@ -1,6 +1,160 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+
+
+_SOURCE_CATEGORIES = MappingProxyType({
+    "Vehicular": "Traffic",
+    "VEH": "Traffic",
+    "VEH ind": "Traffic_ind",
+    "Traffic_exhaust": "Traffic_exhaust",
+    "Traffic_non-exhaust": "Traffic_non-exhaust",
+    "VEH dir": "Traffic_dir",
+    "Oil/Vehicular": "Traffic",
+    "Oil": "Oil",
+    "Vanadium rich": "Vanadium rich",
+    "Road traffic/oil combustion": "Traffic",
+    "Traffic": "Road traffic",
+    "Traffic 1": "Traffic 1",
+    "Traffic 2": "Traffic 2",
+    "Primary traffic": "Road traffic",
+    "Road traffic": "Road traffic",
+    "Road trafic": "Road traffic",
+    "Road traffic/dust": "Traffic/dust (Mix)",
+    "Bio. burning": "Biomass_burning",
+    "Bio burning": "Biomass_burning",
+    "Comb fossile/biomasse": "Biomass_burning",
+    "BB": "Biomass_burning",
+    "Biomass_burning": "Biomass_burning",
+    "Biomass Burning": "Biomass_burning",
+    "Biomass burning": "Biomass_burning",
+    "BB1": "Biomass_burning1",
+    "BB2": "Biomass_burning2",
+    "Sulfate-rich": "Sulfate_rich",
+    "Sulphate-rich": "Sulfate_rich",
+    "Nitrate-rich": "Nitrate_rich",
+    "Sulfate rich": "Sulfate_rich",
+    "Sulfate_rich": "Sulfate_rich",
+    "Nitrate rich": "Nitrate_rich",
+    "Nitrate_rich": "Nitrate_rich",
+    "Secondary inorganics": "Secondary_inorganics",
+    "Secondaire": "MSA_rich",
+    "Secondary bio": "MSA_rich",
+    "Secondary biogenic": "MSA_rich",
+    "Secondary organic": "MSA_rich",
+    "Secondary oxidation": "Secondary_oxidation",
+    "Secondary biogenic oxidation": "Secondary_biogenic_oxidation",
+    "Secondaire organique": "MSA_rich",
+    # "Marine SOA": "Marine SOA",
+    "Marine SOA": "MSA_rich",
+    "MSA_rich": "MSA_rich",
+    "MSA-rich": "MSA_rich",
+    "MSA rich": "MSA_rich",
+    "Secondary biogenic/sulfate": "SOA/sulfate (Mix)",
+    "Marine SOA/SO4": "SOA/sulfate (Mix)",
+    "Marine/HFO": "Marine/HFO",
+    "Marine biogenic/HFO": "Marine/HFO",
+    "Secondary biogenic/HFO": "Marine/HFO",
+    "Marine bio/HFO": "Marine/HFO",
+    "Marin bio/HFO": "Marine/HFO",
+    "Sulfate rich/HFO": "Marine/HFO",
+    "Marine secondary": "MSA_rich",
+    "Marin secondaire": "MSA_rich",
+    "HFO": "HFO",
+    "HFO (stainless)": "HFO",
+    "Marin": "MSA_rich",
+    "Sea/road salt": "Sea-road salt",
+    "Sea-road salt": "Sea-road salt",
+    "sea-road salt": "Sea-road salt",
+    "Road salt": "Salt",
+    "Sea salt": "Salt",
+    "Seasalt": "Salt",
+    "Salt": "Salt",
+    "Fresh seasalt": "Salt",
+    "Sels de mer": "Salt",
+    "Aged_salt": "Aged_salt",
+    "Aged sea salt": "Aged_salt",
+    "Aged seasalt": "Aged_salt",
+    "Aged seasalt": "Aged_salt",
+    "Aged salt": "Aged_salt",
+    "Primary_biogenic": "Primary_biogenic",
+    "Primary bio": "Primary_biogenic",
+    "Primary biogenic": "Primary_biogenic",
+    "Biogénique primaire": "Primary_biogenic",
+    "Biogenique": "Primary_biogenic",
+    "Biogenic": "Primary_biogenic",
+    "Mineral dust": "Dust",
+    "Mineral dust ": "Dust",
+    "Resuspended_dust": "Resuspended_dust",
+    "Resuspended dust": "Resuspended_dust",
+    "Dust": "Dust",
+    "Crustal dust": "Dust",
+    "Dust (mineral)": "Dust",
+    "Dust/biogénique marin": "Dust",
+    "AOS/dust": "Dust",
+    "Industrial": "Industrial",
+    "Industry": "Industrial",
+    "Industrie": "Industrial",
+    "Industries": "Industrial",
+    "Industry/vehicular": "Industry/traffic",
+    "Industry/traffic": "Industry/traffic",
+    "Industries/trafic": "Industry/traffic",
+    "Cadmium rich": "Cadmium rich",
+    "Fioul lourd": "HFO",
+    "Arcellor": "Industrial",
+    "Siderurgie": "Industrial",
+    "Débris végétaux": "Plant_debris",
+    "Chlorure": "Chloride",
+    "PM other": "Other",
+    "Undetermined": "Undertermined",
+})
+
+
+def _extract_date_attr(s, attr):
+    """Array of the datetime attribute `attr` (month, year, dayofyear...) of
+    the Series of dates `s`.
+
+    Use it rather than `s.apply(lambda x: x.<attr>)`: the .dt accessor works
+    on the whole datetime64 array at once, with no Timestamp per row.
+    """
+    return getattr(s.dt, attr).to_numpy()
+
+
+# default mapping of add_season
+_MONTH_TO_SEASON = MappingProxyType({
+    1: "Winter",
+    2: "Winter",
+    3: "Spring",
+    4: "Spring",
+    5: "Spring",
+    6: "Summer",
+    7: "Summer",
+    8: "Summer",
+    9: "Fall",
+    10: "Fall",
+    11: "Fall",
+    12: "Winter",
+})
+
+
+def _season_lut(month_to_season):
+    """Seasons of a month -> season mapping, in order of appearance, and the
+    lookup table giving the season code of each month number (-1 if none).
+    """
+    seasons = list(dict.fromkeys(month_to_season.values()))
+    lut = np.full(13, -1, dtype=np.int8)
+    for m, season in month_to_season.items():
+        lut[m] = seasons.index(season)
+    return seasons, lut
+
+
+_SEASONS, _SEASON_LUT = _season_lut(_MONTH_TO_SEASON)
+
+
+def _month_to_season_codes(months, lut=_SEASON_LUT):
+    """Season codes (see _season_lut) of an integer array of month numbers."""
+    return lut[months]
 
 
 def add_season(df, month=True, month_to_season=None):
@@ -38,51 +192,52 @@ def add_season(df, month=True, month_to_season=None):
     -------
 
     dfnew: pd.DataFrame
-        Copy of input dataframe with a 'season' (and 'month') columns.
+        Copy of input dataframe, in the same row order, with a 'season' (and
+        'month') columns. The 'season' column is an ordered categorical
+        (Winter < Spring < Summer < Fall by default).
+
+    Raises
+    ------
+
+    KeyError
+        If df has no `Date` column nor index level.
 
     """
 
+    if "Date" not in df.index.names and "Date" not in df.columns:
+        raise KeyError("add_season requires a 'Date' column or index level")
+
     if month_to_season is None:
-        month_to_season = {
-            1: "Winter",
-            2: "Winter",
-            3: "Spring",
-            4: "Spring",
-            5: "Spring",
-            6: "Summer",
-            7: "Summer",
-            8: "Summer",
-            9: "Fall",
-            10: "Fall",
-            11: "Fall",
-            12: "Winter",
-        }
-
-    dfnew = df.copy()
+        seasons, lut = _SEASONS, _SEASON_LUT
+    else:
+        seasons, lut = _season_lut(month_to_season)
 
     # ensure we have date in index
-    if "Date" in dfnew.index.names:
-        dfnew["Date"] = dfnew.index.get_level_values("Date")
-        dropDate = True
-    elif "Date" in dfnew.columns:
-        dfnew["Date"] = pd.to_datetime(dfnew["Date"])
-        dropDate = False
+    if "Date" in df.index.names:
+        date = pd.Series(
+            pd.to_datetime(df.index.get_level_values("Date")), index=df.index
+        )
+        new_columns = {}
     else:
-        print("No date given")
-        return
-
-    # add a new column with the number of the month (Jan=1, etc)
-    dfnew["month"] = dfnew["Date"].apply(lambda x: x.month)
-    # sort it. This is not mandatory.
-    dfnew.sort_values(by="month", inplace=True)
-
-    # add the season based on the month number
-    dfnew["season"] = dfnew["month"].replace(month_to_season)
-
-    if not month:
-        dfnew.drop(columns=["month"], inplace=True)
-    if dropDate:
-        dfnew.drop(columns=["Date"], inplace=True)
+        date = pd.to_datetime(df["Date"])
+        new_columns = {"Date": date}
+
+    # number of the month (Jan=1, etc), only kept as a column if asked
+    months = _extract_date_attr(date, "month")
+    if month:
+        new_columns["month"] = months
+
+    # add the season based on the month number (no date: month 0, no season)
+    # categorical, ordered as the seasons first appear in the year
+    codes = _month_to_season_codes(
+        np.nan_to_num(months, nan=0).astype(np.intp), lut
+    )
+    new_columns["season"] = pd.Categorical.from_codes(
+        codes, categories=seasons, ordered=True
+    )
+
+    # only adds columns: the data of df is not copied
+    dfnew = df.assign(**new_columns)
 
     return dfnew
 
@@ -95,229 +250,221 @@ def get_sourcesCategories(profiles):
     Parameters
     ----------
 
-    profiles: list of str
+    profiles: list of str, pd.Series or pd.Index
     
     Returns
     -------
 
-    profiles_renamed : list of str
+    profiles_renamed : list of str, or pd.Series/pd.Index if given one
 
     """
-    possible_sources = {
-        "Vehicular": "Traffic",
-        "VEH": "Traffic",
-        "VEH ind": "Traffic_ind",
-        "Traffic_exhaust": "Traffic_exhaust",
-        "Traffic_non-exhaust": "Traffic_non-exhaust",
-        "VEH dir": "Traffic_dir",
-        "Oil/Vehicular": "Traffic",
-        "Oil": "Oil",
-        "Vanadium rich": "Vanadium rich",
-        "Road traffic/oil combustion": "Traffic",
-        "Traffic": "Road traffic",
-        "Traffic 1": "Traffic 1",
-        "Traffic 2": "Traffic 2",
-        "Primary traffic": "Road traffic",
-        "Road traffic": "Road traffic",
-        "Road trafic": "Road traffic",
-        "Road traffic/dust": "Traffic/dust (Mix)",
-        "Bio. burning": "Biomass_burning",
-        "Bio burning": "Biomass_burning",
-        "Comb fossile/biomasse": "Biomass_burning",
-        "BB": "Biomass_burning",
-        "Biomass_burning": "Biomass_burning",
-        "Biomass Burning": "Biomass_burning",
-        "Biomass burning": "Biomass_burning",
-        "BB1": "Biomass_burning1",
-        "BB2": "Biomass_burning2",
-        "Sulfate-rich": "Sulfate_rich",
-        "Sulphate-rich": "Sulfate_rich",
-        "Nitrate-rich": "Nitrate_rich",
-        "Sulfate rich": "Sulfate_rich",
-        "Sulfate_rich": "Sulfate_rich",
-        "Nitrate rich": "Nitrate_rich",
-        "Nitrate_rich": "Nitrate_rich",
-        "Secondary inorganics": "Secondary_inorganics",
-        "Secondaire": "MSA_rich",
-        "Secondary bio": "MSA_rich",
-        "Secondary biogenic": "MSA_rich",
-        "Secondary organic": "MSA_rich",
-        "Secondary oxidation": "Secondary_oxidation",
-        "Secondary biogenic oxidation": "Secondary_biogenic_oxidation",
-        "Secondaire organique": "MSA_rich",
-        # "Marine SOA": "Marine SOA",
-        "Marine SOA": "MSA_rich",
-        "MSA_rich": "MSA_rich",
-        "MSA-rich": "MSA_rich",
-        "MSA rich": "MSA_rich",
-        "Secondary biogenic/sulfate": "SOA/sulfate (Mix)",
-        "Marine SOA/SO4": "SOA/sulfate (Mix)",
-        "Marine/HFO": "Marine/HFO",
-        "Marine biogenic/HFO": "Marine/HFO",
-        "Secondary biogenic/HFO": "Marine/HFO",
-        "Marine bio/HFO": "Marine/HFO",
-        "Marin bio/HFO": "Marine/HFO",
-        "Sulfate rich/HFO": "Marine/HFO",
-        "Marine secondary": "MSA_rich",
-        "Marin secondaire": "MSA_rich",
-        "HFO": "HFO",
-        "HFO (stainless)": "HFO",
-        "Marin": "MSA_rich",
-        "Sea/road salt": "Sea-road salt",
-        "Sea-road salt": "Sea-road salt",
-        "sea-road salt": "Sea-road salt",
-        "Road salt": "Salt",
-        "Sea salt": "Salt",
-        "Seasalt": "Salt",
-        "Salt": "Salt",
-        "Fresh seasalt": "Salt",
-        "Sels de mer": "Salt",
-        "Aged_salt": "Aged_salt",
-        "Aged sea salt": "Aged_salt",
-        "Aged seasalt": "Aged_salt",
-        "Aged seasalt": "Aged_salt",
-        "Aged salt": "Aged_salt",
-        "Primary_biogenic": "Primary_biogenic",
-        "Primary bio": "Primary_biogenic",
-        "Primary biogenic": "Primary_biogenic",
-        "Biogénique primaire": "Primary_biogenic",
-        "Biogenique": "Primary_biogenic",
-        "Biogenic": "Primary_biogenic",
-        "Mineral dust": "Dust",
-        "Mineral dust ": "Dust",
-        "Resuspended_dust": "Resuspended_dust",
-        "Resuspended dust": "Resuspended_dust",
-        "Dust": "Dust",
-        "Crustal dust": "Dust",
-        "Dust (mineral)": "Dust",
-        "Dust/biogénique marin": "Dust",
-        "AOS/dust": "Dust",
-        "Industrial": "Industrial",
-        "Industry": "Industrial",
-        "Industrie": "Industrial",
-        "Industries": "Industrial",
-        "Industry/vehicular": "Industry/traffic",
-        "Industry/traffic": "Industry/traffic",
-        "Industries/trafic": "Industry/traffic",
-        "Cadmium rich": "Cadmium rich",
-        "Fioul lourd": "HFO",
-        "Arcellor": "Industrial",
-        "Siderurgie": "Industrial",
-        "Débris végétaux": "Plant_debris",
-        "Chlorure": "Chloride",
-        "PM other": "Other",
-        "Undetermined": "Undertermined",
-    }
-    s = [possible_sources.get(k, k) for k in profiles]
+    if isinstance(profiles, (pd.Series, pd.Index)):
+        # look up each distinct name once, pandas maps the values
+        if isinstance(profiles.dtype, pd.CategoricalDtype):
+            names = profiles.dtype.categories
+        else:
+            names = pd.unique(profiles)
+        return profiles.map({k: _SOURCE_CATEGORIES.get(k, k) for k in names})
+
+    s = [_SOURCE_CATEGORIES.get(k, k) for k in profiles]
     return s
 
 
+# source category -> hexadecimal color. The other names of a source are
+# looked up through their category (see get_sourcesCategories), only the
+# names with a color different from their category's are kept here.
+_SOURCE_COLOR = MappingProxyType({
+    "Traffic": "#000000",
+    "Traffic 1": "#000000",
+    "Traffic 2": "#102262",
+    "Road traffic": "#000000",
+    "Traffic_ind": "#000000",
+    "Traffic_exhaust": "#000000",
+    "Traffic_dir": "#444444",
+    "Traffic_non-exhaust": "#444444",
+    "Resuspended_dust": "#444444",
+    "Biomass_burning": "#92d050",
+    "Biomass_burning1": "#92d050",
+    "Biomass_burning2": "#92d050",
+    "Sulphate_rich": "#ff2a2a",
+    "Sulfate_rich": "#ff2a2a",
+    "Nitrate_rich": "#217ecb",  # "#ff7f2a",
+    "Secondary_inorganics": "#0000cc",
+    "MSA_rich": "#ff7f2a",  # 8c564b",
+    "Secondary_oxidation": "#ff87dc",
+    "Secondary_biogenic_oxidation": "#ff87dc",
+    "Biogenic SOA": "#8c564b",
+    "Anthropogenic SOA": "#8c564b",
+    "Marine/HFO": "#a37f15",  # 8c564b",
+    "Aged seasalt/HFO": "#8c564b",
+    "Marine_biogenic": "#fc564b",
+    "HFO": "#70564b",
+    "Oil": "#70564b",
+    "Vanadium rich": "#70564b",
+    "Cadmium rich": "#70564b",
+    "Marine": "#33b0f6",
+    "Marin": "#33b0f6",
+    "Salt": "#00b0f0",
+    "Sea-road salt": "#209ecc",
+    "Fresh sea salt": "#00b0f0",
+    "Aged_salt": "#97bdff",  # 00b0f0",
+    "Fungal spores": "#ffc000",
+    "Primary_biogenic": "#ffc000",
+    "Dust": "#dac6a2",
+    "Crustal_dust": "#dac6a2",
+    "Industrial": "#7030a0",
+    "Indus/veh": "#5c304b",
+    "Industry/traffic": "#5c304b",  # 7030a0",
+    "Plant debris": "#2aff80",
+    "Plant_debris": "#2aff80",
+    "Choride": "#80e5ff",
+    "Cl-rich": "#80e5ff",
+    "PM other": "#cccccc",
+    "Traffic/dust (Mix)": "#333333",
+    "SOA/sulfate (Mix)": "#6c362b",
+    "Sulfate rich/HFO": "#8c56b4",
+    "nan": "#ffffff",
+    "Undetermined": "#666",
+})
+
+
+# names that used to have their own entry in _SOURCE_COLOR, with the same
+# color as the name they point to. They stay listed by get_sourceColor().
+_SOURCE_COLOR_ALIASES = MappingProxyType({
+    "Primary traffic": "Road traffic",
+    "Oil/Vehicular": "Traffic",
+    "Road traffic/oil combustion": "Traffic",
+    "Biomass burning": "Biomass_burning",
+    "Sulphate-rich": "Sulfate_rich",
+    "Sulfate-rich": "Sulfate_rich",
+    "Sulfate rich": "Sulfate_rich",
+    "Nitrate-rich": "Nitrate_rich",
+    "Nitrate rich": "Nitrate_rich",
+    "Secondary inorganics": "Secondary_inorganics",
+    "MSA-rich": "MSA_rich",
+    "Secondary oxidation": "Secondary_oxidation",
+    "Secondary biogenic oxidation": "Secondary_biogenic_oxidation",
+    "Marine SOA": "MSA_rich",
+    "HFO (stainless)": "HFO",
+    "Seasalt": "Salt",
+    "Sea/road salt": "Sea-road salt",
+    "Fresh seasalt": "Salt",
+    "Aged seasalt": "Aged_salt",
+    "Aged sea salt": "Aged_salt",
+    "Primary biogenic": "Primary_biogenic",
+    "Biogenique": "Primary_biogenic",
+    "Biogenic": "Primary_biogenic",
+    "Mineral dust": "Dust",
+    "Industries": "Industrial",
+    "Arcellor": "Industrial",
+    "Siderurgie": "Industrial",
+    "Débris végétaux": "Plant_debris",
+})
+
+
+def _lookup_color(source):
+    """Color of the source, or of its category, None if not known."""
+    color = _SOURCE_COLOR.get(source)
+    if color is None:
+        source = _SOURCE_COLOR_ALIASES.get(source, source)
+        color = _SOURCE_COLOR.get(_SOURCE_CATEGORIES.get(source, source))
+    return color
+
+
+def _source_color(source):
+    """Color of a single source name, #666666 (with a warning) if unknown.
+    Missing labels (NaN, None) are looked up as "nan", other non-text
+    values are unknown.
+    """
+    if isinstance(source, str):
+        color = _lookup_color(source)
+    elif source is None or pd.isna(source):
+        color = _lookup_color("nan")
+    else:
+        color = None
+    if color is None:
+        print("WARNING: no {} found in colors".format(source))
+        return "#666666"
+    return color
+
+
+class _SourceColors(Mapping):
+    """Read-only source -> color mapping returned by get_sourceColor().
+
+    It used to be a one-row DataFrame: `.loc["color"]` and
+    `.loc["color", source]` still work.
+    """
+
+    def __init__(self, colors, aliases):
+        # every name listed: the colors table and its aliases. Other names of
+        # a category are still found by __getitem__.
+        self._names = list(colors) + [a for a in aliases if a not in colors]
+
+    def __getitem__(self, source):
+        color = _lookup_color(source)
+        if color is None:
+            raise KeyError(source)
+        return color
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def loc(self):
+        return _SourceColorsLoc(self)
+
+
+class _SourceColorsLoc:
+    """`.loc` of _SourceColors, as on the former one-row DataFrame."""
+
+    def __init__(self, colors):
+        self._colors = colors
+
+    def __getitem__(self, key):
+        colors = self._colors
+        if isinstance(key, tuple) and len(key) == 2 and key[0] == "color":
+            if isinstance(key[1], str):
+                return colors[key[1]]
+            return pd.Series({s: colors[s] for s in key[1]}, name="color")
+        if key == "color":
+            return pd.Series({s: colors[s] for s in colors}, name="color")
+        raise KeyError(key)
+
+
+_SOURCE_COLORS = _SourceColors(_SOURCE_COLOR, _SOURCE_COLOR_ALIASES)
+
+
 def get_sourceColor(source=None):
     """Return the hexadecimal color of the source(s)
 
-    If no option, then return the whole dictionary
+    If no option, then return the whole dictionary (read-only mapping, that
+    also accepts the former DataFrame indexing `.loc["color", source]`).
 
     Parameters
     ----------
 
-    source : str
-        The name of the source
+    source : str, list of str, pd.Series or pd.Index
+        The name of the source(s)
 
     Returns
     -------
 
-    color : str or pd.DataFrame
-        color in hexadecimal
+    color : str, list of str, pd.Series, pd.Index or Mapping
+        color in hexadecimal, in the same shape as `source`
     """
-    color = {
-        "Traffic": "#000000",
-        "Traffic 1": "#000000",
-        "Traffic 2": "#102262",
-        "Road traffic": "#000000",
-        "Primary traffic": "#000000",
-        "Traffic_ind": "#000000",
-        "Traffic_exhaust": "#000000",
-        "Traffic_dir": "#444444",
-        "Traffic_non-exhaust": "#444444",
-        "Resuspended_dust": "#444444",
-        "Oil/Vehicular": "#000000",
-        "Road traffic/oil combustion": "#000000",
-        "Biomass_burning": "#92d050",
-        "Biomass burning": "#92d050",
-        "Biomass_burning1": "#92d050",
-        "Biomass_burning2": "#92d050",
-        "Sulphate-rich": "#ff2a2a",
-        "Sulphate_rich": "#ff2a2a",
-        "Sulfate-rich": "#ff2a2a",
-        "Sulfate_rich": "#ff2a2a",
-        "Sulfate rich": "#ff2a2a",
-        "Nitrate-rich": "#217ecb",  # "#ff7f2a",
-        "Nitrate_rich": "#217ecb",  # "#ff7f2a",
-        "Nitrate rich": "#217ecb",  # "#ff7f2a",
-        "Secondary_inorganics": "#0000cc",
-        "Secondary inorganics": "#0000cc",
-        "MSA_rich": "#ff7f2a",  # 8c564b",
-        "MSA-rich": "#ff7f2a",  # 8c564b",
-        "Secondary_oxidation": "#ff87dc",
-        "Secondary_biogenic_oxidation": "#ff87dc",
-        "Secondary oxidation": "#ff87dc",
-        "Secondary biogenic oxidation": "#ff87dc",
-        "Marine SOA": "#ff7f2a",  # 8c564b",
-        "Biogenic SOA": "#8c564b",
-        "Anthropogenic SOA": "#8c564b",
-        "Marine/HFO": "#a37f15",  # 8c564b",
-        "Aged seasalt/HFO": "#8c564b",
-        "Marine_biogenic": "#fc564b",
-        "HFO": "#70564b",
-        "HFO (stainless)": "#70564b",
-        "Oil": "#70564b",
-        "Vanadium rich": "#70564b",
-        "Cadmium rich": "#70564b",
-        "Marine": "#33b0f6",
-        "Marin": "#33b0f6",
-        "Salt": "#00b0f0",
-        "Seasalt": "#00b0f0",
-        "Sea-road salt": "#209ecc",
-        "Sea/road salt": "#209ecc",
-        "Fresh sea salt": "#00b0f0",
-        "Fresh seasalt": "#00b0f0",
-        "Aged_salt": "#97bdff",  # 00b0f0",
-        "Aged seasalt": "#97bdff",  # 00b0f0",
-        "Aged sea salt": "#97bdff",  # 00b0f0",
-        "Fungal spores": "#ffc000",
-        "Primary_biogenic": "#ffc000",
-        "Primary biogenic": "#ffc000",
-        "Biogenique": "#ffc000",
-        "Biogenic": "#ffc000",
-        "Dust": "#dac6a2",
-        "Mineral dust": "#dac6a2",
-        "Crustal_dust": "#dac6a2",
-        "Industrial": "#7030a0",
-        "Industries": "#7030a0",
-        "Indus/veh": "#5c304b",
-        "Industry/traffic": "#5c304b",  # 7030a0",
-        "Arcellor": "#7030a0",
-        "Siderurgie": "#7030a0",
-        "Plant debris": "#2aff80",
-        "Plant_debris": "#2aff80",
-        "Débris végétaux": "#2aff80",
-        "Choride": "#80e5ff",
-        "Cl-rich": "#80e5ff",
-        "PM other": "#cccccc",
-        "Traffic/dust (Mix)": "#333333",
-        "SOA/sulfate (Mix)": "#6c362b",
-        "Sulfate rich/HFO": "#8c56b4",
-        "nan": "#ffffff",
-        "Undetermined": "#666",
-    }
-    color = pd.DataFrame(index=["color"], data=color)
-    if source:
-        if source not in color.keys():
-            print("WARNING: no {} found in colors".format(source))
-            return "#666666"
-        return color.loc["color", source]
-    else:
-        return color
+    if isinstance(source, (pd.Series, pd.Index)):
+        # look each distinct name up once, pandas maps the values
+        return source.map({s: _source_color(s) for s in pd.unique(source)})
+    if pd.api.types.is_list_like(source):
+        return [_source_color(s) for s in source]
+
+    if source is None or (isinstance(source, str) and not source):
+        return _SOURCE_COLORS
+
+    return _source_color(source)
 
 
 def format_xaxis_timeseries(ax):
@@ -330,6 +477,9 @@ def format_xaxis_timeseries(ax):
         The axe to format
 
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+
     ax.xaxis.set_major_locator(mdates.YearLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%b\n%Y"))
     ax.xaxis.set_minor_locator(mdates.MonthLocator())